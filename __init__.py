@@ -10,30 +10,82 @@ import http.server
 import socketserver
 import queue
 import importlib
-from urllib.parse import unquote_plus
-from bpy.props import EnumProperty
+import os
+import tempfile
+from bpy.props import EnumProperty, BoolProperty, FloatProperty, IntProperty, StringProperty
 from bpy.types import PropertyGroup
 
+# Only reload when the add-on itself is being reloaded; on first import the
+# submodules below are fresh and reloading them would just execute them twice
+_reloading = "stroke_consumer_module" in locals()
+
 # Import the module with a distinct name to avoid conflict
+from . import brush_mappings as brush_mappings_module
+from . import profiling as profiling_module
+from . import spatial_chunks as spatial_chunks_module
+from . import lod as lod_module
+from . import resources as resources_module
+from . import sequencing as sequencing_module
+from . import materials as materials_module
+from . import wire_format as wire_format_module
+from . import stream_listener as stream_listener_module
+from . import local_transport as local_transport_module
+from . import render_jobs as render_jobs_module
 from . import stroke_consumer as stroke_consumer_module
 from . import grease_pencil_stroke_consumer as gp_consumer_module
 from . import curve_stroke_consumer as curve_consumer_module
-from . import brush_mappings as brush_mappings_module
+from . import converter as converter_module
+from . import openbrush_client as openbrush_client_module
 
-if "bpy" in locals():
-    importlib.reload(stroke_consumer_module)
+if _reloading:
+    # Dependencies first, so dependants pick up the reloaded modules
     importlib.reload(brush_mappings_module)
+    importlib.reload(profiling_module)
+    importlib.reload(spatial_chunks_module)
+    importlib.reload(lod_module)
+    importlib.reload(resources_module)
+    importlib.reload(sequencing_module)
+    importlib.reload(materials_module)
+    importlib.reload(wire_format_module)
+    importlib.reload(stream_listener_module)
+    importlib.reload(local_transport_module)
+    importlib.reload(render_jobs_module)
+    importlib.reload(stroke_consumer_module)
     importlib.reload(gp_consumer_module)
     importlib.reload(curve_consumer_module)
+    importlib.reload(converter_module)
+    importlib.reload(openbrush_client_module)
 
 from .grease_pencil_stroke_consumer import GreasePencilStrokeConsumer
 from .curve_stroke_consumer import CurveStrokeConsumer
 
 PORT = 8080
+STREAM_PORT = 8081  # Length-prefixed TCP stream channel, see stream_listener.py
 httpd = None
 server_thread = None
+stream_server = None
+stream_thread = None
+LOCAL_SOCKET_PATH = local_transport_module.default_socket_path()
+local_source = None
 stroke_queue = queue.Queue()
+COMMAND_SOURCES = []  # Polled by the stroke consumer on the main thread
+REORDER_BUFFER = sequencing_module.ReorderBuffer()  # Shared so it survives consumer swaps
 STROKE_CONSUMER_INSTANCE = None  # Will be set based on preference
+RENDER_JOBS = render_jobs_module.RenderJobManager()
+OPENBRUSH_CLIENT = openbrush_client_module.OpenBrushClient()
+
+def get_listener_url() -> str:
+    return f"http://localhost:{PORT}/"
+
+def get_cache_dir() -> str:
+    """Writable cache directory for snapshots, renders and captures."""
+    try:
+        return bpy.utils.extension_path_user(__package__, path="cache", create=True)
+    except (ValueError, AttributeError):
+        # Legacy add-on install without an extension user directory
+        path = os.path.join(tempfile.gettempdir(), "openbrush_blender_connector")
+        os.makedirs(path, exist_ok=True)
+        return path
 
 def get_stroke_consumer():
     """Get the appropriate stroke consumer based on user preference."""
@@ -44,12 +96,29 @@ def get_stroke_consumer():
        (bpy.context.scene.openbrush_settings.stroke_type == 'CURVE' and not isinstance(STROKE_CONSUMER_INSTANCE, CurveStrokeConsumer)):
         
         if bpy.context.scene.openbrush_settings.stroke_type == 'CURVE':
-            STROKE_CONSUMER_INSTANCE = CurveStrokeConsumer(stroke_queue)
+            STROKE_CONSUMER_INSTANCE = CurveStrokeConsumer(stroke_queue, COMMAND_SOURCES, REORDER_BUFFER)
         else:
-            STROKE_CONSUMER_INSTANCE = GreasePencilStrokeConsumer(stroke_queue)
+            STROKE_CONSUMER_INSTANCE = GreasePencilStrokeConsumer(stroke_queue, COMMAND_SOURCES, REORDER_BUFFER)
     
     return STROKE_CONSUMER_INSTANCE
 
+def apply_studio_brush_table(scene):
+    settings = getattr(scene, 'openbrush_settings', None)
+    path = settings.studio_brush_table if settings is not None else ""
+    brush_mappings_module.set_studio_table(bpy.path.abspath(path) if path else None)
+
+def update_studio_brush_table(self, context):
+    apply_studio_brush_table(context.scene)
+
+@bpy.app.handlers.persistent
+def load_post_handler(_):
+    # The studio table path is saved with the scene; apply it on file load
+    apply_studio_brush_table(bpy.context.scene)
+
+def update_use_lod(self, context):
+    # Turning LOD off shows every full stroke again and hides the LOD copies
+    lod_module.apply_lod(context, self.lod_viewport_mode if self.use_lod else 'FULL', self.lod_distance)
+
 class OpenBrushSettings(PropertyGroup):
     stroke_type: EnumProperty(
         name="Stroke Type",
@@ -60,37 +129,189 @@ class OpenBrushSettings(PropertyGroup):
         ],
         default='GREASE_PENCIL',
     )
+    use_local_socket: BoolProperty(
+        name="Local Socket",
+        description="Also accept stroke frames from same-host producers on a Unix domain socket",
+        default=False,
+    )
+    prewarm_materials: BoolProperty(
+        name="Prewarm Materials",
+        description="Build brush materials in the background when the listener starts",
+        default=True,
+    )
+    prewarm_brush_set: EnumProperty(
+        name="Brush Set",
+        description="Brushes whose materials are prewarmed",
+        items=[
+            ('STANDARD', "Standard", "All non-experimental brushes"),
+            ('ALL', "All", "Every brush, including experimental ones"),
+        ],
+        default='STANDARD',
+    )
+    material_library: StringProperty(
+        name="Material Library",
+        description="Optional .blend file to append prewarmed materials from, by material name",
+        subtype='FILE_PATH',
+        default="",
+    )
+    studio_brush_table: StringProperty(
+        name="Studio Brushes",
+        description="Optional CSV brush table (same columns as brushes.csv) whose rows add to or override the built-in brushes",
+        subtype='FILE_PATH',
+        default="",
+        update=update_studio_brush_table,
+    )
+    render_workers: IntProperty(
+        name="Render Workers",
+        description="Number of background Blender processes used for render jobs",
+        default=1,
+        min=1,
+        max=64,
+    )
+    soft_point_limit: IntProperty(
+        name="Point Limit",
+        description="Warn or consolidate once imported strokes exceed this many points (0 disables)",
+        default=0,
+        min=0,
+    )
+    soft_datablock_limit: IntProperty(
+        name="Datablock Limit",
+        description="Warn or consolidate once the add-on has created this many datablocks (0 disables)",
+        default=0,
+        min=0,
+    )
+    limit_action: EnumProperty(
+        name="On Limit",
+        description="What to do when a soft limit is exceeded",
+        items=[
+            ('WARN', "Warn", "Print a warning to the console"),
+            ('CONSOLIDATE', "Consolidate", "Merge per-stroke curve objects and purge orphaned datablocks"),
+        ],
+        default='WARN',
+    )
+    use_spatial_chunks: BoolProperty(
+        name="Spatial Chunks",
+        description="Bucket strokes into a uniform 3D grid, one Grease Pencil layer or collection per cell",
+        default=False,
+    )
+    chunk_size: FloatProperty(
+        name="Chunk Size",
+        description="Edge length of a grid cell",
+        default=2.0,
+        min=0.01,
+        unit='LENGTH',
+    )
+    chunk_view_radius: IntProperty(
+        name="View Radius",
+        description="Number of cells around the 3D cursor kept visible when culling chunks",
+        default=1,
+        min=0,
+    )
+    use_lod: BoolProperty(
+        name="Level of Detail",
+        description="Also create a decimated copy of each stroke for the viewport; renders use the full stroke",
+        default=False,
+        update=update_use_lod,
+    )
+    lod_ratio: EnumProperty(
+        name="LOD Ratio",
+        description="Fraction of points kept in the decimated copy",
+        items=lod_module.LOD_RATIOS,
+        default='0.25',
+    )
+    lod_viewport_mode: EnumProperty(
+        name="Viewport",
+        description="Which variant is shown in the viewport",
+        items=[
+            ('LOD', "LOD", "Show decimated strokes in the viewport"),
+            ('FULL', "Full", "Show full-resolution strokes in the viewport"),
+            ('DISTANCE', "Distance", "Show decimated strokes beyond a distance from the scene camera"),
+        ],
+        default='LOD',
+    )
+    lod_distance: FloatProperty(
+        name="LOD Distance",
+        description="Camera distance beyond which decimated strokes are shown",
+        default=10.0,
+        min=0.0,
+        unit='LENGTH',
+    )
 
 class RequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP request handler for Blender OpenBrush connector."""
 
     def handle_action(self, action: str, params: dict = None, payload: str = None) -> dict:
         """Dispatches actions to the appropriate handler."""
+        params = params or {}
         if action == 'render':
-            bpy.ops.render.render(animation=True)
-            return {'status': 'success'}
+            job = RENDER_JOBS.submit(params)
+            return {'status': 'queued', 'job_id': job.id}
+        if action == 'render/status':
+            if 'id' in params:
+                job = RENDER_JOBS.get_status(params['id'])
+                return {'status': 'success', 'job': job} if job else {'status': 'not_found', 'id': params['id']}
+            return {'status': 'success', 'jobs': RENDER_JOBS.get_status()}
+        if action == 'metrics':
+            return {'status': 'success', 'metrics': resources_module.TRACKER.metrics(),
+                    'sequencing': REORDER_BUFFER.stats()}
+        if action == 'profile':
+            profiling_module.PROFILER.request_capture(
+                ticks=int(params['ticks']) if 'ticks' in params else None,
+                seconds=float(params['seconds']) if 'seconds' in params else None,
+            )
+            return {'status': 'capture_requested'}
+        if action == 'profile/status':
+            return {'status': 'success', **profiling_module.PROFILER.status()}
+        if action == 'render/cancel' and 'id' in params:
+            return {'status': 'cancelled' if RENDER_JOBS.cancel(params['id']) else 'not_found', 'id': params['id']}
         if action == 'stroke' and payload:
             stroke_queue.put(payload)
             return {'status': 'queued'}
         return {'status': 'unknown_action', 'action': action}
 
+    def queue_commands(self, commands: list) -> None:
+        """Queue commands from one request, tagged with a sequence number when
+        the producer sent X-OpenBrush-Source / X-OpenBrush-Seq headers."""
+        seq = self.headers.get(sequencing_module.SEQ_HEADER)
+        if seq is not None:
+            source = self.headers.get(sequencing_module.SOURCE_HEADER, self.client_address[0])
+            stroke_queue.put(sequencing_module.SequencedCommands(source, int(seq), commands))
+        elif len(commands) == 1:
+            stroke_queue.put(commands[0])
+        else:
+            # One queue item, so commands from concurrent requests can't interleave
+            stroke_queue.put(sequencing_module.SourcedCommands(None, commands))
+
     def handle_request(self, action: str, params: dict, payload: str = None) -> dict:
         """Handles incoming requests by delegating to handle_action."""
         return self.handle_action(action, params, payload) if action else {'status': 'no_action'}
 
     def do_POST(self):
-        """Handles POST requests with URL-encoded stroke data."""
+        """Handles POST requests with URL-encoded or binary stroke data.
+
+        The body may be compressed with Content-Encoding gzip or deflate.
+        Binary bodies (see wire_format) are selected by Content-Type."""
         try:
             content_length = int(self.headers['Content-Length'])
+            if content_length > wire_format_module.MAX_BODY_SIZE:
+                self.close_connection = True
+                raise wire_format_module.WireFormatError(
+                    f"Body of {content_length} bytes exceeds {wire_format_module.MAX_BODY_SIZE} bytes")
             post_data = self.rfile.read(content_length)
-            
-            # Decode URL-encoded data
-            decoded_data = unquote_plus(post_data.decode('utf-8'))
-            print(f"Decoded POST data: {decoded_data}")
-            
-            # Queue the command for the stroke consumer
-            stroke_queue.put(decoded_data)
-            result = {'status': 'queued'}
+            post_data = wire_format_module.decompress_body(post_data, self.headers.get('Content-Encoding'))
+
+            if wire_format_module.is_binary_content_type(self.headers.get('Content-Type')):
+                commands = wire_format_module.decode_binary_strokes(post_data)
+                self.queue_commands(commands)
+                result = {'status': 'queued', 'commands': len(commands)}
+            else:
+                # Decode URL-encoded data
+                decoded_data = wire_format_module.decode_text_body(post_data)
+                print(f"Decoded POST data: {decoded_data}")
+
+                # Queue the command for the stroke consumer
+                self.queue_commands([decoded_data])
+                result = {'status': 'queued'}
             
         except Exception as e:
             print(f"POST error: {e}")
@@ -104,19 +325,27 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
         self.wfile.write(json.dumps(result).encode('utf-8'))
 
     def do_GET(self):
-        """Handles GET requests with URL parameters."""
+        """Handles GET requests with URL parameters.
+
+        Requests to the root path carry stroke commands; other paths such as
+        /render or /render/status are dispatched through handle_request."""
         from urllib.parse import urlparse, parse_qs, unquote
         try:
             parsed_path = urlparse(self.path)
             query_string = parsed_path.query
-            
-            print(f"GET query: {query_string}")
-            
-            # Queue the command directly for the stroke consumer
-            if query_string:
-                stroke_queue.put(query_string)
-            
-            result = {'status': 'success'}
+            action = parsed_path.path.strip('/')
+
+            if action:
+                params = {key: values[-1] for key, values in parse_qs(query_string).items()}
+                result = self.handle_request(action, params)
+            else:
+                print(f"GET query: {query_string}")
+
+                # Queue the command directly for the stroke consumer
+                if query_string:
+                    self.queue_commands([query_string])
+
+                result = {'status': 'success'}
         except Exception as e:
             print(f"GET error: {e}")
             result = {'status': 'error', 'message': str(e)}
@@ -127,7 +356,7 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
 
 
 def start_http_server():
-    global httpd, server_thread
+    global httpd, server_thread, stream_server, stream_thread
 
     if httpd is None:
         handler = RequestHandler
@@ -135,8 +364,46 @@ def start_http_server():
         server_thread = threading.Thread(target=httpd.serve_forever)
         server_thread.start()
 
+    if stream_server is None:
+        try:
+            stream_server, stream_thread = stream_listener_module.start_stream_server(STREAM_PORT, stroke_queue)
+        except OSError as e:
+            print(f"Stream listener could not start on port {STREAM_PORT}: {e}")
+
+    if local_source is None and local_transport_module.is_supported() \
+            and bpy.context.scene.openbrush_settings.use_local_socket:
+        start_local_source()
+
+    # Re-register with Open Brush if this listener was registered before
+    OPENBRUSH_CLIENT.on_listener_started(get_listener_url())
+
+def start_local_source():
+    global local_source
+
+    source = local_transport_module.UnixSocketCommandSource(LOCAL_SOCKET_PATH)
+    try:
+        source.open()
+    except OSError as e:
+        print(f"Local socket could not be opened at {LOCAL_SOCKET_PATH}: {e}")
+        return
+    local_source = source
+    COMMAND_SOURCES.append(source)
+
+def stop_local_source():
+    global local_source
+
+    if local_source is not None:
+        COMMAND_SOURCES.remove(local_source)
+        local_source.close()
+        local_source = None
+
 def stop_http_server():
-    global httpd, server_thread
+    global httpd, server_thread, stream_server, stream_thread
+
+    stop_local_source()
+    stream_listener_module.stop_stream_server(stream_server, stream_thread)
+    stream_server = None
+    stream_thread = None
 
     if httpd is not None:
         httpd.shutdown()
@@ -145,9 +412,36 @@ def stop_http_server():
         httpd = None
         server_thread = None
 
+def check_resource_limits(settings):
+    tracker = resources_module.TRACKER
+    exceeded = tracker.check_limits(settings.soft_point_limit, settings.soft_datablock_limit)
+    if not exceeded:
+        return
+    print(f"Open Brush soft limit exceeded: {', '.join(exceeded)}")
+    if settings.limit_action == 'CONSOLIDATE':
+        merged = resources_module.consolidate_curves()
+        purged = resources_module.purge_orphans()
+        tracker.rescan()
+        print(f"Consolidated {merged} curve objects, purged {purged} orphaned datablocks")
+
+def start_material_prewarm(settings):
+    if settings.prewarm_brush_set == 'ALL':
+        brushes = brush_mappings_module.get_brushes_by_property()
+    else:
+        brushes = brush_mappings_module.get_brushes_by_property(is_experimental=False)
+    materials_module.PREWARMER.start(settings.stroke_type, brushes, settings.material_library)
+
 def process_stroke_queue():
+    profiler = profiling_module.PROFILER
+    profiler.begin_tick()
     consumer = get_stroke_consumer()
-    consumer.process_queue()
+    with profiler.stage('process_queue'):
+        consumer.process_queue()
+    settings = bpy.context.scene.openbrush_settings
+    with profiler.stage('render_jobs'):
+        RENDER_JOBS.process_pending(get_cache_dir(), settings.render_workers)
+    check_resource_limits(settings)
+    profiler.end_tick(get_cache_dir())
     return 0.1  # seconds until next call
 
 class HTTP_LISTENER_OT_toggle(bpy.types.Operator):
@@ -159,11 +453,15 @@ class HTTP_LISTENER_OT_toggle(bpy.types.Operator):
         
         if httpd is None:
             # Start the server
+            apply_studio_brush_table(context.scene)
             start_http_server()
-            self.report({'INFO'}, "HTTP Listener started on port {}".format(PORT))
+            if context.scene.openbrush_settings.prewarm_materials:
+                start_material_prewarm(context.scene.openbrush_settings)
+            self.report({'INFO'}, "HTTP Listener started on port {} (stream port {})".format(PORT, STREAM_PORT))
         else:
             # Stop the server
             stop_http_server()
+            materials_module.PREWARMER.stop()
             self.report({'INFO'}, "HTTP Listener stopped")
         
         return {'FINISHED'}
@@ -173,28 +471,122 @@ class HTTP_LISTENER_OT_register(bpy.types.Operator):
     bl_label = "Register with Open Brush"
 
     def execute(self, context):
-        import urllib.request
-        import urllib.error
+        # Registration runs on the client's background thread; progress shows in the panel
+        OPENBRUSH_CLIENT.register(get_listener_url())
+        self.report({'INFO'}, "Registering with Open Brush...")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_render_job(bpy.types.Operator):
+    bl_idname = "http_listener.render_job"
+    bl_label = "Render in Background"
+    bl_description = "Snapshot the scene and render its animation in a background Blender process"
+
+    def execute(self, context):
+        job = RENDER_JOBS.submit()
+        self.report({'INFO'}, f"Render job {job.id} queued")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_profile(bpy.types.Operator):
+    bl_idname = "http_listener.profile"
+    bl_label = "Profile Pipeline"
+    bl_description = "Capture a cProfile and per-stage timings of the stroke pipeline"
+
+    ticks: IntProperty(
+        name="Timer Ticks",
+        description="Number of queue-processing ticks to capture",
+        default=50,
+        min=1,
+    )
+
+    def execute(self, context):
+        profiling_module.PROFILER.request_capture(ticks=self.ticks)
+        self.report({'INFO'}, f"Profiling the next {self.ticks} ticks")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_purge(bpy.types.Operator):
+    bl_idname = "http_listener.purge"
+    bl_label = "Purge Orphans"
+    bl_description = "Remove orphaned Open Brush curves, Grease Pencil data and materials"
+
+    consolidate: BoolProperty(
+        name="Consolidate Curves",
+        description="Also merge per-stroke curve objects into one object per collection and material",
+        default=False,
+    )
+
+    def execute(self, context):
+        merged = resources_module.consolidate_curves() if self.consolidate else 0
+        purged = resources_module.purge_orphans()
+        resources_module.TRACKER.rescan()
+        self.report({'INFO'}, f"Purged {purged} datablocks, merged {merged} curve objects")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_reload_brushes(bpy.types.Operator):
+    bl_idname = "http_listener.reload_brushes"
+    bl_label = "Reload Brushes"
+    bl_description = "Re-read the brush tables without restarting the listener"
+
+    def execute(self, context):
         try:
-            # Register this Blender instance with Open Brush
-            url = f"http://localhost:40074/api/v1?listenfor.strokes=http://localhost:{PORT}/"
-            response = urllib.request.urlopen(url, timeout=5)
-            
-            if response.status == 200:
-                self.report({'INFO'}, "Successfully registered with Open Brush")
-            else:
-                self.report({'WARNING'}, f"Open Brush responded with status {response.status}")
-            
-        except urllib.error.URLError as e:
-            if hasattr(e, 'reason'):
-                self.report({'ERROR'}, f"Failed to connect to Open Brush: {e.reason}")
-            elif hasattr(e, 'code'):
-                self.report({'ERROR'}, f"Open Brush returned error code: {e.code}")
-            else:
-                self.report({'ERROR'}, f"Failed to register: {str(e)}")
-        except Exception as e:
-            self.report({'ERROR'}, f"Unexpected error: {str(e)}")
-        
+            apply_studio_brush_table(context.scene)
+            count = brush_mappings_module.reload_brush_mappings()
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.report({'ERROR'}, f"Failed to reload brushes: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Loaded {count} brushes")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_convert_strokes(bpy.types.Operator):
+    bl_idname = "http_listener.convert_strokes"
+    bl_label = "Convert Strokes"
+    bl_description = "Convert existing Open Brush strokes between Grease Pencil and curves"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    direction: EnumProperty(
+        name="Direction",
+        items=[
+            ('GP_TO_CURVE', "Grease Pencil → Curves", "Convert the Grease Pencil strokes shown on the current frame to curves"),
+            ('CURVE_TO_GP', "Curves → Grease Pencil", "Convert curve strokes to Grease Pencil strokes on the current frame"),
+        ],
+        default='GP_TO_CURVE',
+    )
+    remove_source: BoolProperty(
+        name="Remove Source",
+        description="Delete the converted originals: curve objects, or the converted Grease Pencil keyframes",
+        default=False,
+    )
+
+    def execute(self, context):
+        import time
+        start = time.perf_counter()
+        if self.direction == 'GP_TO_CURVE':
+            strokes, points = converter_module.grease_pencil_to_curves(context, self.remove_source)
+        else:
+            strokes, points = converter_module.curves_to_grease_pencil(context, self.remove_source)
+        resources_module.TRACKER.rescan()
+        self.report({'INFO'}, f"Converted {strokes} strokes ({points} points) in {time.perf_counter() - start:.2f}s")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_cull_chunks(bpy.types.Operator):
+    bl_idname = "http_listener.cull_chunks"
+    bl_label = "Cull Chunks Around Cursor"
+    bl_description = "Hide stroke chunks farther than the view radius from the 3D cursor"
+
+    def execute(self, context):
+        settings = context.scene.openbrush_settings
+        visible, hidden = spatial_chunks_module.cull_chunks(context, settings.chunk_view_radius)
+        self.report({'INFO'}, f"{visible} chunks visible, {hidden} hidden")
+        return {'FINISHED'}
+
+class HTTP_LISTENER_OT_apply_lod(bpy.types.Operator):
+    bl_idname = "http_listener.apply_lod"
+    bl_label = "Apply LOD Visibility"
+    bl_description = "Switch stroke objects between full and decimated variants in the viewport"
+
+    def execute(self, context):
+        settings = context.scene.openbrush_settings
+        count = lod_module.apply_lod(context, settings.lod_viewport_mode, settings.lod_distance)
+        self.report({'INFO'}, f"Updated visibility of {count} stroke objects")
         return {'FINISHED'}
 
 class HTTP_LISTENER_PT_panel(bpy.types.Panel):
@@ -211,6 +603,45 @@ class HTTP_LISTENER_PT_panel(bpy.types.Panel):
 
         # Stroke type selector
         layout.prop(settings, "stroke_type", text="Stroke Type")
+        if local_transport_module.is_supported():
+            layout.prop(settings, "use_local_socket")
+
+        # Bulk conversion of existing strokes
+        row = layout.row(align=True)
+        row.operator("http_listener.convert_strokes", text="GP → Curves").direction = 'GP_TO_CURVE'
+        row.operator("http_listener.convert_strokes", text="Curves → GP").direction = 'CURVE_TO_GP'
+
+        # Brush tables
+        row = layout.row(align=True)
+        row.prop(settings, "studio_brush_table", text="")
+        row.operator("http_listener.reload_brushes", text="", icon='FILE_REFRESH')
+
+        # Material prewarming
+        layout.prop(settings, "prewarm_materials")
+        if settings.prewarm_materials:
+            col = layout.column(align=True)
+            col.prop(settings, "prewarm_brush_set")
+            col.prop(settings, "material_library")
+            if materials_module.PREWARMER.active:
+                col.label(text=f"Prewarming {len(materials_module.PREWARMER.pending)} materials...", icon='TIME')
+
+        # Spatial chunking
+        layout.prop(settings, "use_spatial_chunks")
+        if settings.use_spatial_chunks:
+            col = layout.column(align=True)
+            col.prop(settings, "chunk_size")
+            col.prop(settings, "chunk_view_radius")
+            col.operator("http_listener.cull_chunks")
+
+        # Level of detail
+        layout.prop(settings, "use_lod")
+        if settings.use_lod:
+            col = layout.column(align=True)
+            col.prop(settings, "lod_ratio")
+            col.prop(settings, "lod_viewport_mode")
+            if settings.lod_viewport_mode == 'DISTANCE':
+                col.prop(settings, "lod_distance")
+            col.operator("http_listener.apply_lod")
         
         layout.separator()
 
@@ -223,6 +654,46 @@ class HTTP_LISTENER_PT_panel(bpy.types.Panel):
 
         row = layout.row()
         row.operator("http_listener.register")
+        client_status = OPENBRUSH_CLIENT.get_status()
+        if client_status['status'] != 'idle':
+            layout.label(text=f"Open Brush: {client_status['status']}")
+            if client_status['last_error']:
+                layout.label(text=client_status['last_error'], icon='ERROR')
+
+        # Background render jobs
+        layout.separator()
+        row = layout.row(align=True)
+        row.operator("http_listener.render_job")
+        row.prop(settings, "render_workers", text="")
+        counts = RENDER_JOBS.counts()
+        if counts:
+            layout.label(text=", ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+
+        # Resource accounting
+        layout.separator()
+        totals = resources_module.TRACKER.metrics()['total']
+        col = layout.column(align=True)
+        col.label(text=f"Strokes: {totals['strokes']}  Points: {totals['points']}")
+        col.label(text=f"Datablocks: {totals['datablocks']}  ~{totals['approx_bytes'] / (1024 * 1024):.1f} MB")
+        row = layout.row(align=True)
+        row.operator("http_listener.purge").consolidate = False
+        row.operator("http_listener.purge", text="Consolidate").consolidate = True
+        col = layout.column(align=True)
+        col.prop(settings, "soft_point_limit")
+        col.prop(settings, "soft_datablock_limit")
+        col.prop(settings, "limit_action")
+
+        # Profiler capture
+        layout.separator()
+        profiler_status = profiling_module.PROFILER.status()
+        if profiler_status['active'] or profiler_status['pending']:
+            layout.label(text="Profiling...", icon='TIME')
+        else:
+            layout.operator("http_listener.profile")
+        if profiler_status['summary']:
+            col = layout.column(align=True)
+            for line in profiler_status['summary']:
+                col.label(text=line)
 
 def register():
     bpy.utils.register_class(OpenBrushSettings)
@@ -230,18 +701,38 @@ def register():
     
     bpy.utils.register_class(HTTP_LISTENER_OT_toggle)
     bpy.utils.register_class(HTTP_LISTENER_OT_register)
+    bpy.utils.register_class(HTTP_LISTENER_OT_render_job)
+    bpy.utils.register_class(HTTP_LISTENER_OT_profile)
+    bpy.utils.register_class(HTTP_LISTENER_OT_purge)
+    bpy.utils.register_class(HTTP_LISTENER_OT_reload_brushes)
+    bpy.utils.register_class(HTTP_LISTENER_OT_convert_strokes)
+    bpy.utils.register_class(HTTP_LISTENER_OT_cull_chunks)
+    bpy.utils.register_class(HTTP_LISTENER_OT_apply_lod)
     bpy.utils.register_class(HTTP_LISTENER_PT_panel)
     bpy.app.timers.register(process_stroke_queue)
+    bpy.app.handlers.load_post.append(load_post_handler)
 
 def unregister():
     bpy.utils.unregister_class(HTTP_LISTENER_OT_toggle)
     bpy.utils.unregister_class(HTTP_LISTENER_OT_register)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_render_job)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_profile)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_purge)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_reload_brushes)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_convert_strokes)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_cull_chunks)
+    bpy.utils.unregister_class(HTTP_LISTENER_OT_apply_lod)
     bpy.utils.unregister_class(HTTP_LISTENER_PT_panel)
+    if load_post_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post_handler)
     
     del bpy.types.Scene.openbrush_settings
     bpy.utils.unregister_class(OpenBrushSettings)
     
     stop_http_server()
+    OPENBRUSH_CLIENT.stop()
+    materials_module.PREWARMER.stop()
+    RENDER_JOBS.shutdown()
     try:
         bpy.app.timers.unregister(process_stroke_queue)
     except Exception:
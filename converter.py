@@ -0,0 +1,245 @@
+"""
+Bulk conversion of existing Open Brush strokes between Grease Pencil and curves.
+
+Switching the stroke type only affects strokes drawn afterwards. These
+converters rewrite what is already in the file. Point data is read and
+written with attribute foreach_get/foreach_set into numpy arrays, so the
+per-point work never runs in Python loops.
+
+Brush, radius and color are preserved:
+- Brush comes from the material's brush tag, or from its name for
+  materials created before tags existed.
+- Curve radii are point radius times bevel depth; converted curves use a
+  bevel depth of 1.
+- Grease Pencil vertex colors become the object color of converted curves,
+  with one curve object per brush and color. Curve colors come back from
+  the object color, or from the material when the object color is unset.
+"""
+
+import bpy
+import numpy as np
+from typing import Optional, Tuple
+
+from .brush_mappings import get_brush_mapping, load_brush_table
+from .lod import is_lod_object, LOD_PROP
+from . import materials
+
+
+def _brush_guid_for_material(mat: Optional[bpy.types.Material]) -> Optional[str]:
+    if mat is None:
+        return None
+    guid = mat.get(materials.BRUSH_PROP)
+    if guid:
+        return guid
+    if mat.name.startswith("OpenBrushCurve_"):
+        guid = mat.name[len("OpenBrushCurve_"):].split('.')[0]
+        return None if guid == "Fallback" else guid
+    if mat.name.startswith("OpenBrushGP_"):
+        brush_name = mat.name[len("OpenBrushGP_"):].split('.')[0]
+        for guid, mapping in load_brush_table().items():
+            if mapping.name == brush_name:
+                return guid
+    return None
+
+
+def _attribute(drawing, name: str, data_type: str, domain: str):
+    attribute = drawing.attributes.get(name)
+    if attribute is None:
+        attribute = drawing.attributes.new(name, data_type, domain)
+    return attribute
+
+
+def _read_attribute(drawing, name: str, prop: str, count: int, width: int, default) -> np.ndarray:
+    """Read a drawing attribute into an array, or fill with default when absent."""
+    values = np.empty(count * width, dtype=np.float32 if not isinstance(default, int) else np.int32)
+    attribute = drawing.attributes.get(name)
+    if attribute is None:
+        values.fill(default)
+    else:
+        attribute.data.foreach_get(prop, values)
+    return values.reshape(count, width) if width > 1 else values
+
+
+def _current_drawings(gp_obj: bpy.types.Object, frame_number: int):
+    """Yield (layer, frame) for the keyframe each layer shows at frame_number,
+    including keyframes held from an earlier frame."""
+    for layer in gp_obj.data.layers:
+        shown = None
+        for frame in layer.frames:
+            if frame.frame_number <= frame_number and (shown is None or frame.frame_number > shown.frame_number):
+                shown = frame
+        if shown is not None:
+            yield layer, shown
+
+
+def grease_pencil_to_curves(context, remove_source: bool = False) -> Tuple[int, int]:
+    """Convert the Open Brush Grease Pencil strokes shown on the current frame
+    to curves. Returns (strokes, points) converted.
+
+    With remove_source, only the converted keyframes are removed; a Grease
+    Pencil object is deleted once none of its layers has keyframes left."""
+    frame_number = context.scene.frame_current
+    total_strokes = total_points = 0
+
+    for gp_obj in [obj for obj in bpy.data.objects
+                   if obj.type == 'GREASEPENCIL' and obj.name.startswith("OpenBrushGP") and not is_lod_object(obj)]:
+        collection = gp_obj.users_collection[0] if gp_obj.users_collection else context.collection
+        matrix = np.array(gp_obj.matrix_world, dtype=np.float32)
+        slot_materials = list(gp_obj.data.materials)
+
+        converted = []
+        for layer, frame in _current_drawings(gp_obj, frame_number):
+            drawing = frame.drawing
+            point_count = len(drawing.attributes['position'].data)
+            stroke_count = len(drawing.strokes)
+            if not point_count or not stroke_count:
+                continue
+
+            positions = _read_attribute(drawing, 'position', 'vector', point_count, 3, 0.0)
+            positions = positions @ matrix[:3, :3].T + matrix[:3, 3]
+            radii = _read_attribute(drawing, 'radius', 'value', point_count, 1, 0.01)
+            colors = _read_attribute(drawing, 'vertex_color', 'color', point_count, 4, 1.0)
+            material_indices = _read_attribute(drawing, 'material_index', 'value', stroke_count, 1, 0)
+            offsets = np.empty(stroke_count + 1, dtype=np.int32)
+            drawing.curve_offsets.foreach_get('value', offsets)
+
+            co = np.ones((point_count, 4), dtype=np.float32)
+            co[:, :3] = positions
+
+            # Group strokes by material slot and (rounded) stroke color
+            stroke_colors = np.round(colors[offsets[:-1], :3], 3)
+            groups = {}
+            for stroke_index in range(stroke_count):
+                key = (int(material_indices[stroke_index]), tuple(stroke_colors[stroke_index].tolist()))
+                groups.setdefault(key, []).append(stroke_index)
+
+            for (slot, color), stroke_indices in groups.items():
+                gp_mat = slot_materials[slot] if slot < len(slot_materials) else None
+                guid = _brush_guid_for_material(gp_mat)
+                mat = materials.get_material(materials.curve_material_name(guid), color,
+                                             materials.CURVE_EMISSION_STRENGTH, 'CURVE', guid)
+
+                curve_data = bpy.data.curves.new(name='OpenBrushStroke', type='CURVE')
+                curve_data.dimensions = '3D'
+                curve_data.bevel_depth = 1.0
+                curve_data.bevel_resolution = 4
+                curve_data.materials.append(mat)
+
+                for stroke_index in stroke_indices:
+                    start, end = offsets[stroke_index], offsets[stroke_index + 1]
+                    if end - start < 1:
+                        continue
+                    spline = curve_data.splines.new(type='POLY')
+                    spline.points.add(end - start - 1)
+                    spline.points.foreach_set('co', co[start:end].ravel())
+                    spline.points.foreach_set('radius', radii[start:end])
+                    total_points += end - start
+                    total_strokes += 1
+
+                curve_obj = bpy.data.objects.new('OpenBrushStroke', curve_data)
+                curve_obj.color = (*color, 1.0)
+                collection.objects.link(curve_obj)
+            converted.append((layer, frame.frame_number))
+
+        if remove_source:
+            for layer, converted_frame in converted:
+                layer.frames.remove(converted_frame)
+            if not any(len(layer.frames) for layer in gp_obj.data.layers):
+                data = gp_obj.data
+                bpy.data.objects.remove(gp_obj)
+                if data.users == 0:
+                    bpy.data.grease_pencils.remove(data)
+
+    return total_strokes, total_points
+
+
+def curves_to_grease_pencil(context, remove_source: bool = False) -> Tuple[int, int]:
+    """Convert Open Brush curve objects to strokes on the current frame of the
+    Grease Pencil object. Returns (strokes, points) converted."""
+    sources = [obj for obj in bpy.data.objects
+               if obj.type == 'CURVE' and obj.data.name.startswith("OpenBrushStroke") and not is_lod_object(obj)]
+    if not sources:
+        return 0, 0
+
+    # Same target as the Grease Pencil consumer with LOD off: the untagged
+    # Open Brush object, never a hidden full/LOD object or a user's own object
+    gp_obj = next((obj for obj in bpy.data.objects
+                   if obj.type == 'GREASEPENCIL' and obj.name.startswith("OpenBrushGP")
+                   and obj.get(LOD_PROP) is None), None)
+    if gp_obj is None:
+        gp_data = bpy.data.grease_pencils.new('OpenBrushGP')
+        gp_obj = bpy.data.objects.new('OpenBrushGP', gp_data)
+        context.collection.objects.link(gp_obj)
+    gp = gp_obj.data
+    layer = gp.layers.get('OpenBrushConverted') or gp.layers.new('OpenBrushConverted')
+    frame = next((f for f in layer.frames if f.frame_number == context.scene.frame_current), None)
+    if frame is None:
+        frame = layer.frames.new(context.scene.frame_current)
+    drawing = frame.drawing
+    # Curve points go to world space, then into the Grease Pencil object's space
+    to_gp = np.linalg.inv(np.array(gp_obj.matrix_world, dtype=np.float64)).astype(np.float32)
+
+    # Gather every spline as array chunks first, then write them in one batch
+    sizes, co_chunks, radius_chunks, color_chunks, opacity_chunks, slots = [], [], [], [], [], []
+    for obj in sources:
+        curve = obj.data
+        mat = curve.materials[0] if curve.materials else None
+        guid = _brush_guid_for_material(mat)
+        mapping = get_brush_mapping(guid)
+        if tuple(obj.color) != (1.0, 1.0, 1.0, 1.0) or mat is None:
+            color = tuple(obj.color[:3])
+        else:
+            color = tuple(mat.diffuse_color[:3])
+        gp_mat = materials.get_material(materials.gp_material_name(mapping), color,
+                                        materials.gp_emission(mapping), 'GREASE_PENCIL', guid)
+        if gp_mat.name not in gp.materials:
+            gp.materials.append(gp_mat)
+        slot = gp.materials.find(gp_mat.name)
+        matrix = to_gp @ np.array(obj.matrix_world, dtype=np.float32)
+
+        for spline in curve.splines:
+            count = len(spline.points)
+            if count < 2:
+                continue
+            co = np.empty(count * 4, dtype=np.float32)
+            radius = np.empty(count, dtype=np.float32)
+            spline.points.foreach_get('co', co)
+            spline.points.foreach_get('radius', radius)
+            positions = co.reshape(count, 4)[:, :3] @ matrix[:3, :3].T + matrix[:3, 3]
+
+            sizes.append(count)
+            co_chunks.append(positions)
+            radius_chunks.append(radius * curve.bevel_depth)
+            color_chunks.append(np.tile(np.array((*color, mapping.opacity_scale), dtype=np.float32), (count, 1)))
+            opacity_chunks.append(np.full(count, mapping.opacity_scale, dtype=np.float32))
+            slots.append(slot)
+
+    if not sizes:
+        return 0, 0
+
+    first_point = len(drawing.attributes['position'].data)
+    first_stroke = len(drawing.strokes)
+    drawing.add_strokes(sizes=tuple(sizes))
+    point_count = len(drawing.attributes['position'].data)
+    stroke_count = len(drawing.strokes)
+
+    def write(name, data_type, domain, prop, width, new_values, first, count, default):
+        attribute = _attribute(drawing, name, data_type, domain)
+        values = _read_attribute(drawing, name, prop, count, width, default)
+        values[first:] = new_values
+        attribute.data.foreach_set(prop, values.ravel())
+
+    write('position', 'FLOAT_VECTOR', 'POINT', 'vector', 3, np.concatenate(co_chunks), first_point, point_count, 0.0)
+    write('radius', 'FLOAT', 'POINT', 'value', 1, np.concatenate(radius_chunks), first_point, point_count, 0.01)
+    write('opacity', 'FLOAT', 'POINT', 'value', 1, np.concatenate(opacity_chunks), first_point, point_count, 1.0)
+    write('vertex_color', 'FLOAT_COLOR', 'POINT', 'color', 4, np.concatenate(color_chunks), first_point, point_count, 0.0)
+    write('material_index', 'INT', 'CURVE', 'value', 1, np.array(slots, dtype=np.int32), first_stroke, stroke_count, 0)
+
+    if remove_source:
+        for obj in sources:
+            data = obj.data
+            bpy.data.objects.remove(obj)
+            if data.users == 0:
+                bpy.data.curves.remove(data)
+
+    return len(sizes), int(sum(sizes))
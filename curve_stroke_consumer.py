@@ -1,67 +1,83 @@
 import bpy
 from .stroke_consumer import BaseStrokeConsumer
+from .spatial_chunks import get_chunk_collection
+from .profiling import PROFILER
+from .resources import TRACKER
+from . import materials
+from .lod import decimate_path, tag_object, LOD_SUFFIX
 
 class CurveStrokeConsumer(BaseStrokeConsumer):
     """Consumes stroke commands and creates Bezier curve strokes in Blender."""
-    
+    resource_kind = 'CURVE'
+
     def process_current_path(self) -> None:
-        if not self.current_path or len(self.current_path) < 2:
-            print(f"Skipping path: too few points ({len(self.current_path) if self.current_path else 0})")
+        if self.path_length() < 2:
+            print(f"Skipping path: too few points ({self.path_length()})")
             return
-        
+
         print(f"Processing stroke with {len(self.current_path)} points as curve")
         print(f"Brush: {self.current_brush}, Size: {self.current_brush_size}, Color: {self.current_color}")
-        
+
+        collection = bpy.context.collection
+        key = self.current_chunk_key()
+        if key is not None:
+            collection = get_chunk_collection(collection, key)
+
+        with PROFILER.stage('material'):
+            mat = self.get_material()
+        curve_obj = self.create_curve_object('OpenBrushStroke', self.current_path, mat, collection)
+
+        print(f"Created curve stroke with {len(curve_obj.data.splines[0].points)} points")
+
+        lod_ratio = self.current_lod_ratio()
+        if lod_ratio is not None:
+            lod_path = decimate_path(self.current_path, lod_ratio)
+            lod_obj = self.create_curve_object('OpenBrushStroke' + LOD_SUFFIX, lod_path, mat, collection)
+            show_lod = self.show_lod_in_viewport()
+            tag_object(curve_obj, 'FULL', show_lod)
+            tag_object(lod_obj, 'LOD', show_lod)
+            print(f"Created LOD curve stroke with {len(lod_path)} points")
+
+        # Force viewport update
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+    def create_curve_object(self, name: str, path, mat, collection) -> bpy.types.Object:
+        """Create a poly curve object for `path` and link it to `collection`."""
         # Create a new curve for each stroke
-        curve_data = bpy.data.curves.new(name='OpenBrushStroke', type='CURVE')
+        curve_data = bpy.data.curves.new(name=name, type='CURVE')
         curve_data.dimensions = '3D'
         curve_data.bevel_depth = self.current_brush_size * 0.01  # Convert to reasonable size
         curve_data.bevel_resolution = 4
-        
+
         # Create a new spline in the curve
         spline = curve_data.splines.new(type='POLY')
-        spline.points.add(len(self.current_path) - 1)  # -1 because spline starts with 1 point
-        
-        # Set point positions
-        for i, pt in enumerate(self.current_path):
-            # Convert from Unity coordinates (Z forward) to Blender (Z up)
-            # Unity: X, Y, Z → Blender: X, Z, Y
-            # Curve points use 4D coordinates (x, y, z, w)
-            spline.points[i].co = (pt[0], pt[2], pt[1], 1.0)
-            # Optionally use pressure to vary radius
-            if len(pt) > 6:
-                spline.points[i].radius = pt[6]
-        
-        # Create object from curve
-        curve_obj = bpy.data.objects.new('OpenBrushStroke', curve_data)
-        bpy.context.collection.objects.link(curve_obj)
-        
-        # Create or get material
-        brush_name = self.current_brush or "Fallback"
-        mat_name = f"OpenBrushCurve_{brush_name}"
-        mat = bpy.data.materials.get(mat_name)
-        
-        if mat is None:
-            print(f"Creating new material: {mat_name}")
-            mat = bpy.data.materials.new(mat_name)
-            mat.use_nodes = True
-            mat.diffuse_color = (*self.current_color, 1.0)
-            if mat.node_tree and mat.node_tree.nodes:
-                bsdf = mat.node_tree.nodes.get('Principled BSDF')
-                if bsdf:
-                    bsdf.inputs['Base Color'].default_value = (*self.current_color, 1.0)
-                    bsdf.inputs['Emission Color'].default_value = (*self.current_color, 1.0)
-                    bsdf.inputs['Emission Strength'].default_value = 0.5
-        
+        spline.points.add(len(path) - 1)  # -1 because spline starts with 1 point
+
+        with PROFILER.stage('points'):
+            # Set point positions
+            for i, pt in enumerate(path):
+                # Convert from Unity coordinates (Z forward) to Blender (Z up)
+                # Unity: X, Y, Z → Blender: X, Z, Y
+                # Curve points use 4D coordinates (x, y, z, w)
+                spline.points[i].co = (pt[0], pt[2], pt[1], 1.0)
+                # Optionally use pressure to vary radius
+                if len(pt) > 6:
+                    spline.points[i].radius = pt[6]
+
         # Assign material to curve
-        if curve_data.materials:
-            curve_data.materials[0] = mat
-        else:
-            curve_data.materials.append(mat)
-        
-        print(f"Created curve stroke with {len(spline.points)} points")
-        
-        # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        curve_data.materials.append(mat)
+
+        # Create object from curve
+        curve_obj = bpy.data.objects.new(name, curve_data)
+        collection.objects.link(curve_obj)
+        TRACKER.add_datablocks(self.resource_kind, 'curves')
+        TRACKER.add_datablocks(self.resource_kind, 'objects')
+        TRACKER.add_stroke(self.resource_kind, len(path))
+        return curve_obj
+
+    def get_material(self):
+        """Look up (or create) the material for the current brush."""
+        return materials.get_material(materials.curve_material_name(self.current_brush), self.current_color,
+                                      materials.CURVE_EMISSION_STRENGTH, self.resource_kind, self.current_brush)
@@ -1,45 +1,96 @@
 import bpy
+from typing import Optional
 from .stroke_consumer import BaseStrokeConsumer
-from .brush_mappings import get_brush_mapping
+from .brush_mappings import get_brush_mapping, BrushMapping
+from .spatial_chunks import chunk_name
+from .profiling import PROFILER
+from .resources import TRACKER
+from . import materials
+from .lod import decimate_path, tag_object, LOD_PROP, LOD_SUFFIX, FULL_SUFFIX
 
 class GreasePencilStrokeConsumer(BaseStrokeConsumer):
     """Consumes stroke commands and creates Grease Pencil strokes in Blender.
     Compatible with Blender 5.0+ Grease Pencil v3."""
-    
+    resource_kind = 'GREASE_PENCIL'
+
     def process_current_path(self) -> None:
-        if not self.current_path or len(self.current_path) < 2:
-            print(f"Skipping path: too few points ({len(self.current_path) if self.current_path else 0})")
+        if self.path_length() < 2:
+            print(f"Skipping path: too few points ({self.path_length()})")
             return
-        
+
         # Get brush mapping for current brush
         brush_mapping = get_brush_mapping(self.current_brush)
-        
+
         print(f"Processing stroke with {len(self.current_path)} points")
         print(f"Brush: {brush_mapping.name} ({self.current_brush}), Size: {self.current_brush_size}, Color: {self.current_color}")
-        
-        # Find or create a Grease Pencil object
+
+        # Strokes drawn with LOD on go to a separate full object, so objects
+        # holding strokes without a LOD copy are never hidden
+        lod_ratio = self.current_lod_ratio()
+        gp_obj = self.get_gp_object(None if lod_ratio is None else 'FULL')
+        stroke = self.add_stroke(gp_obj, self.current_path, brush_mapping)
+
+        print(f"Created Grease Pencil stroke with {len(stroke.points)} points using {brush_mapping.name} brush")
+
+        if lod_ratio is not None:
+            lod_obj = self.get_gp_object('LOD')
+            lod_stroke = self.add_stroke(lod_obj, decimate_path(self.current_path, lod_ratio), brush_mapping)
+            print(f"Created LOD stroke with {len(lod_stroke.points)} points")
+
+        # Force viewport update
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+    def get_gp_object(self, level: Optional[str]) -> bpy.types.Object:
+        """Find or create the Grease Pencil object for untagged (None), 'FULL'
+        or 'LOD' strokes."""
         # Blender 5.0 uses 'GREASEPENCIL' instead of 'GPENCIL'
-        gp_obj = None
         for obj in bpy.data.objects:
-            if obj.type == 'GREASEPENCIL':
-                gp_obj = obj
-                break
-        
-        if gp_obj is None:
-            print("Creating new Grease Pencil object")
-            # Blender 5.0 uses grease_pencils
-            gp_data = bpy.data.grease_pencils.new('OpenBrushGP')
-            gp_obj = bpy.data.objects.new('OpenBrushGP', gp_data)
-            bpy.context.collection.objects.link(gp_obj)
-        
-        gp = gp_obj.data
-        
-        # Get or create a layer
-        if not gp.layers:
+            if obj.type == 'GREASEPENCIL' and obj.get(LOD_PROP) == level:
+                return obj
+
+        name = 'OpenBrushGP' + {None: '', 'FULL': FULL_SUFFIX, 'LOD': LOD_SUFFIX}[level]
+        print(f"Creating new Grease Pencil object {name}")
+        # Blender 5.0 uses grease_pencils
+        gp_data = bpy.data.grease_pencils.new(name)
+        gp_obj = bpy.data.objects.new(name, gp_data)
+        bpy.context.collection.objects.link(gp_obj)
+        TRACKER.add_datablocks(self.resource_kind, 'grease_pencils')
+        TRACKER.add_datablocks(self.resource_kind, 'objects')
+        if level is not None:
+            tag_object(gp_obj, level, self.show_lod_in_viewport())
+        return gp_obj
+
+    def get_layer(self, gp):
+        """Get or create a layer, one per grid cell when spatial chunking is on."""
+        key = self.current_chunk_key()
+        if key is not None:
+            layer_name = chunk_name(key)
+            layer = gp.layers.get(layer_name)
+            if layer is None:
+                layer = gp.layers.new(layer_name)
+        elif not gp.layers:
             layer = gp.layers.new('OpenBrushLayer')
         else:
             layer = gp.layers[0]
-        
+        return layer
+
+    def get_material(self, gp_obj: bpy.types.Object, brush_mapping: BrushMapping) -> int:
+        """Look up (or create) the brush material and return its slot index on the object."""
+        mat = materials.get_material(materials.gp_material_name(brush_mapping), self.current_color,
+                                     materials.gp_emission(brush_mapping), self.resource_kind, self.current_brush)
+
+        # Assign material to object if not already assigned
+        if mat.name not in gp_obj.data.materials:
+            gp_obj.data.materials.append(mat)
+
+        return gp_obj.data.materials.find(mat.name)
+
+    def add_stroke(self, gp_obj: bpy.types.Object, path, brush_mapping: BrushMapping):
+        """Append a stroke for `path` to the current frame of `gp_obj`."""
+        layer = self.get_layer(gp_obj.data)
+
         # Get or create frame
         current_frame = bpy.context.scene.frame_current
         frame = None
@@ -49,77 +100,50 @@ class GreasePencilStrokeConsumer(BaseStrokeConsumer):
                 break
         if frame is None:
             frame = layer.frames.new(current_frame)
-        
+
         # In Blender 5.0, frame has a 'drawing' attribute
         drawing = frame.drawing
-        
-        # Create or get material
-        brush_name = brush_mapping.name
-        mat_name = f"OpenBrushGP_{brush_name}"
-        mat = bpy.data.materials.get(mat_name)
-        
-        if mat is None:
-            print(f"Creating new material: {mat_name}")
-            mat = bpy.data.materials.new(mat_name)
-            mat.use_nodes = True
-            mat.diffuse_color = (*self.current_color, 1.0)
-            
-            if mat.node_tree and mat.node_tree.nodes:
-                bsdf = mat.node_tree.nodes.get('Principled BSDF')
-                if bsdf:
-                    bsdf.inputs['Base Color'].default_value = (*self.current_color, 1.0)
-                    
-                    # Apply emission if brush mapping specifies it
-                    if brush_mapping.use_emission:
-                        bsdf.inputs['Emission Color'].default_value = (*self.current_color, 1.0)
-                        bsdf.inputs['Emission Strength'].default_value = brush_mapping.emission_strength
-        
-        # Assign material to object if not already assigned
-        if mat.name not in gp_obj.data.materials:
-            gp_obj.data.materials.append(mat)
-        
-        mat_index = gp_obj.data.materials.find(mat.name)
-        
+
+        with PROFILER.stage('material'):
+            mat_index = self.get_material(gp_obj, brush_mapping)
+
         # Create stroke in the drawing
         # In Blender 5.0, use add_strokes() method on the drawing object
-        drawing.add_strokes(sizes=(len(self.current_path),))
-        
+        drawing.add_strokes(sizes=(len(path),))
+
         # Get the newly created stroke (it's the last one)
         stroke = drawing.strokes[-1]
-        
-        # Set point positions and attributes
-        for i, pt in enumerate(self.current_path):
-            # Convert from Unity coordinates (Z forward) to Blender (Z up)
-            # Unity: X, Y, Z → Blender: X, Z, Y
-            stroke.points[i].position = (pt[0], pt[2], pt[1])
-            
-            # Apply radius with brush mapping scale
-            base_radius = self.current_brush_size * brush_mapping.radius_scale * 0.01
-            if brush_mapping.use_pressure and len(pt) > 6:
-                stroke.points[i].radius = base_radius * pt[6]
-            else:
-                stroke.points[i].radius = base_radius
-            
-            # Apply vertex color with opacity scale
-            opacity = brush_mapping.opacity_scale
-            stroke.points[i].vertex_color = (*self.current_color, opacity)
-            
-            # Set opacity/strength
-            if hasattr(stroke.points[i], 'opacity'):
-                stroke.points[i].opacity = opacity
-            if hasattr(stroke.points[i], 'strength'):
-                stroke.points[i].strength = brush_mapping.strength_scale
-        
+
+        with PROFILER.stage('points'):
+            # Set point positions and attributes
+            for i, pt in enumerate(path):
+                # Convert from Unity coordinates (Z forward) to Blender (Z up)
+                # Unity: X, Y, Z → Blender: X, Z, Y
+                stroke.points[i].position = (pt[0], pt[2], pt[1])
+
+                # Apply radius with brush mapping scale
+                base_radius = self.current_brush_size * brush_mapping.radius_scale * 0.01
+                if brush_mapping.use_pressure and len(pt) > 6:
+                    stroke.points[i].radius = base_radius * pt[6]
+                else:
+                    stroke.points[i].radius = base_radius
+
+                # Apply vertex color with opacity scale
+                opacity = brush_mapping.opacity_scale
+                stroke.points[i].vertex_color = (*self.current_color, opacity)
+
+                # Set opacity/strength
+                if hasattr(stroke.points[i], 'opacity'):
+                    stroke.points[i].opacity = opacity
+                if hasattr(stroke.points[i], 'strength'):
+                    stroke.points[i].strength = brush_mapping.strength_scale
+
         # Set stroke material
         stroke.material_index = mat_index
-        
+        TRACKER.add_stroke(self.resource_kind, len(path))
+
         # TODO: Apply corner_type and cap_mode when API is available
         # These properties may need to be set via operators or attributes
         # For now, they use default values
-        
-        print(f"Created Grease Pencil stroke with {len(stroke.points)} points using {brush_mapping.name} brush")
-        
-        # Force viewport update
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+
+        return stroke
@@ -0,0 +1,148 @@
+"""
+Same-host Unix domain socket transport for local producers.
+
+Capture tools running on the same machine can connect to a Unix socket
+instead of going through TCP. The socket is non-blocking and polled from
+the main thread by the stroke consumer as an extra command source, so no
+listener thread or queue hand-off is involved. Connections use the same
+length-prefixed frames as the TCP stream channel (see wire_format). Data
+is received into a preallocated buffer and copied into each connection's
+FrameReader; complete frames are copied out once more as their payload,
+and binary stroke points are then viewed straight from that payload.
+
+The socket lives in the user's runtime directory (XDG_RUNTIME_DIR, or the
+temp directory with the user ID in the name) and is only accessible to
+its owner. A socket that another running instance is still serving is
+never replaced.
+
+Only available where the platform supports AF_UNIX.
+"""
+
+import os
+import socket
+import tempfile
+from typing import List
+
+from .wire_format import FrameReader, decode_frame, WireFormatError
+from .sequencing import SourcedCommands
+
+RECV_SIZE = 256 * 1024
+# Upper bound on bytes read per poll so a flood cannot stall the UI
+MAX_POLL_BYTES = 8 * 1024 * 1024
+
+
+def is_supported() -> bool:
+    return hasattr(socket, 'AF_UNIX')
+
+
+def default_socket_path() -> str:
+    """Per-user socket path, preferring the private XDG runtime directory."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "openbrush_blender.sock")
+    uid = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"openbrush_blender-{uid}.sock")
+
+
+def _is_live_socket(path: str) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+class UnixSocketCommandSource:
+    """Command source that accepts framed commands on a Unix domain socket."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sock = None
+        self.clients = {}
+        self.connection_count = 0
+        self.recv_buffer = bytearray(RECV_SIZE)
+
+    @property
+    def is_open(self) -> bool:
+        return self.sock is not None
+
+    def open(self) -> None:
+        if self.sock is not None:
+            return
+        if os.path.exists(self.path):
+            if _is_live_socket(self.path):
+                raise OSError(f"{self.path} is in use by another process")
+            # Remove a stale socket file left behind by a previous session
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.path)
+            os.chmod(self.path, 0o600)
+            sock.listen()
+        except OSError:
+            sock.close()
+            raise
+        sock.setblocking(False)
+        self.sock = sock
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+        self.clients.clear()
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def _accept_pending(self) -> None:
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            client.setblocking(False)
+            self.connection_count += 1
+            self.clients[client] = (FrameReader(), f"local:{self.connection_count}")
+
+    def poll(self) -> List[object]:
+        """Return the frames that have fully arrived since the last poll, each as
+        SourcedCommands tagged with its connection."""
+        if self.sock is None:
+            return []
+        self._accept_pending()
+
+        commands = []
+        view = memoryview(self.recv_buffer)
+        budget = MAX_POLL_BYTES
+        for client, (reader, source) in list(self.clients.items()):
+            closed = False
+            while budget > 0:
+                try:
+                    received = client.recv_into(view)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    closed = True
+                    break
+                if not received:
+                    closed = True
+                    break
+                budget -= received
+                try:
+                    for kind, payload in reader.feed(view[:received]):
+                        commands.append(SourcedCommands(source, decode_frame(kind, payload)))
+                except (WireFormatError, ValueError) as e:
+                    print(f"Local socket error: {e}")
+                    closed = True
+                    break
+            if closed:
+                client.close()
+                del self.clients[client]
+                commands.append(SourcedCommands(source, [], end=True))
+        return commands
@@ -0,0 +1,87 @@
+"""
+Level-of-detail variants for imported strokes.
+
+When enabled, the consumers write a decimated copy of every stroke next to
+the full-resolution one. LOD objects never render; full objects are hidden
+in the viewport while the LOD is active, so switching between them only
+toggles object visibility and never requires re-importing. Strokes drawn
+while LOD is off stay in untagged objects and are always visible.
+
+Distance-based switching works per object. Curve strokes are one object
+each, but all Grease Pencil strokes of a kind share one object, so in
+'DISTANCE' mode they switch together based on that object's centre.
+"""
+
+import bpy
+import numpy as np
+from mathutils import Vector
+
+# Fixed point-count ratios offered in the UI
+LOD_RATIOS = [
+    ('0.5', "50%", "Keep half of the points"),
+    ('0.25', "25%", "Keep a quarter of the points"),
+    ('0.1', "10%", "Keep a tenth of the points"),
+]
+
+# Custom property used to tag stroke objects as 'FULL' or 'LOD'
+LOD_PROP = "openbrush_lod"
+LOD_SUFFIX = "_LOD"
+FULL_SUFFIX = "_Full"
+
+
+def decimate_path(path, ratio: float) -> np.ndarray:
+    """Keep an evenly spaced subset of points, always including both endpoints."""
+    points = np.asarray(path, dtype=np.float32)
+    count = len(points)
+    keep = max(2, int(np.ceil(count * ratio)))
+    if keep >= count:
+        return points
+    indices = np.round(np.linspace(0, count - 1, keep)).astype(np.int64)
+    return points[indices]
+
+
+def tag_object(obj: bpy.types.Object, level: str, show_lod: bool = True) -> None:
+    """Tag a stroke object as 'FULL' or 'LOD' and set its initial visibility."""
+    obj[LOD_PROP] = level
+    if level == 'LOD':
+        obj.hide_render = True
+        obj.hide_viewport = not show_lod
+    else:
+        obj.hide_viewport = show_lod
+
+
+def is_lod_object(obj: bpy.types.Object) -> bool:
+    return obj.get(LOD_PROP) == 'LOD'
+
+
+def apply_lod(context, mode: str, distance: float = 10.0) -> int:
+    """Switch viewport visibility between full and LOD stroke objects.
+
+    mode is 'LOD' (decimated in the viewport), 'FULL' (full resolution in
+    the viewport) or 'DISTANCE' (LOD for objects farther than `distance`
+    from the scene camera, measured per object). Renders always use the
+    full objects.
+    Returns the number of objects updated.
+    """
+    camera = context.scene.camera
+    camera_location = np.asarray(camera.matrix_world.translation) if camera else None
+    updated = 0
+
+    for obj in bpy.data.objects:
+        level = obj.get(LOD_PROP)
+        if level is None:
+            continue
+
+        if mode == 'DISTANCE' and camera_location is not None:
+            centre = np.mean([obj.matrix_world @ Vector(corner) for corner in obj.bound_box], axis=0)
+            use_lod = np.linalg.norm(centre - camera_location) > distance
+        else:
+            use_lod = mode != 'FULL'
+
+        if level == 'LOD':
+            obj.hide_viewport = not use_lod
+        else:
+            obj.hide_viewport = use_lod
+        updated += 1
+
+    return updated
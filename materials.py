@@ -0,0 +1,153 @@
+"""
+Brush materials shared by the stroke consumers, and prewarming.
+
+Building a material and its node tree is the most expensive part of the
+first stroke with a new brush. When the listener starts, MaterialPrewarmer
+builds (or appends from a library .blend) the materials for a brush set,
+a few per timer tick, so that the stroke hot path only has to look them
+up. Prewarmed materials are tagged and take the color of the first stroke
+that uses them, as materials created on demand do.
+"""
+
+import bpy
+import time
+from collections import deque
+from typing import Iterable, Optional, Tuple
+
+from .brush_mappings import BrushMapping
+from .resources import TRACKER
+
+PREWARM_PROP = "openbrush_prewarmed"
+BRUSH_PROP = "openbrush_brush"
+
+# Emission used by curve materials regardless of brush
+CURVE_EMISSION_STRENGTH = 0.5
+
+
+def gp_material_name(brush_mapping: BrushMapping) -> str:
+    return f"OpenBrushGP_{brush_mapping.name}"
+
+
+def curve_material_name(brush_guid: Optional[str]) -> str:
+    return f"OpenBrushCurve_{brush_guid or 'Fallback'}"
+
+
+def apply_color(mat: bpy.types.Material, color: tuple, emission_strength: Optional[float]) -> None:
+    mat.diffuse_color = (*color, 1.0)
+    if mat.node_tree and mat.node_tree.nodes:
+        bsdf = mat.node_tree.nodes.get('Principled BSDF')
+        if bsdf:
+            bsdf.inputs['Base Color'].default_value = (*color, 1.0)
+            if emission_strength is not None:
+                bsdf.inputs['Emission Color'].default_value = (*color, 1.0)
+                bsdf.inputs['Emission Strength'].default_value = emission_strength
+
+
+def create_material(name: str, color: tuple, emission_strength: Optional[float],
+                    resource_kind: str, brush_guid: Optional[str] = None) -> bpy.types.Material:
+    """Create a node-based brush material. emission_strength None means no emission."""
+    print(f"Creating new material: {name}")
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    if brush_guid:
+        mat[BRUSH_PROP] = brush_guid
+    apply_color(mat, color, emission_strength)
+    TRACKER.add_datablocks(resource_kind, 'materials')
+    return mat
+
+
+def get_material(name: str, color: tuple, emission_strength: Optional[float],
+                 resource_kind: str, brush_guid: Optional[str] = None) -> bpy.types.Material:
+    """Look up a brush material, creating it on a miss."""
+    mat = bpy.data.materials.get(name)
+    if mat is None:
+        return create_material(name, color, emission_strength, resource_kind, brush_guid)
+    if mat.get(PREWARM_PROP):
+        # First use of a prewarmed material: take this stroke's color
+        apply_color(mat, color, emission_strength)
+        del mat[PREWARM_PROP]
+    return mat
+
+
+def gp_emission(brush_mapping: BrushMapping) -> Optional[float]:
+    return brush_mapping.emission_strength if brush_mapping.use_emission else None
+
+
+def prewarm_specs(stroke_type: str, brushes: Iterable[Tuple[str, BrushMapping]]):
+    """(name, emission_strength, resource_kind, guid) for each material a brush set needs."""
+    seen = set()
+    for guid, mapping in brushes:
+        if stroke_type == 'CURVE':
+            spec = (curve_material_name(guid), CURVE_EMISSION_STRENGTH, 'CURVE', guid)
+        else:
+            spec = (gp_material_name(mapping), gp_emission(mapping), 'GREASE_PENCIL', guid)
+        if spec[0] not in seen:
+            seen.add(spec[0])
+            yield spec
+
+
+class MaterialPrewarmer:
+    """Builds materials for a brush set across timer ticks."""
+
+    def __init__(self, budget_ms: float = 4.0):
+        self.budget_ms = budget_ms
+        self.pending = deque()
+        self.created = 0
+        # Timers are looked up by identity, and every `self.tick` access makes
+        # a new bound method, so register and unregister the same object
+        self._tick = self.tick
+
+    @property
+    def active(self) -> bool:
+        return bool(self.pending)
+
+    def start(self, stroke_type: str, brushes, library_path: str = "") -> None:
+        """Queue the materials for `brushes` and start ticking. Main thread only."""
+        specs = [spec for spec in prewarm_specs(stroke_type, brushes)
+                 if bpy.data.materials.get(spec[0]) is None]
+        if library_path and specs:
+            specs = self._append_from_library(library_path, specs)
+        self.pending.extend(specs)
+        self.created = 0
+        if self.pending and not bpy.app.timers.is_registered(self._tick):
+            bpy.app.timers.register(self._tick, first_interval=0.0)
+
+    def _append_from_library(self, library_path: str, specs: list) -> list:
+        """Append whichever materials the library provides; return the rest."""
+        wanted = {spec[0] for spec in specs}
+        try:
+            with bpy.data.libraries.load(bpy.path.abspath(library_path), link=False) as (data_from, data_to):
+                data_to.materials = [name for name in data_from.materials if name in wanted]
+        except OSError as e:
+            print(f"Material library could not be loaded: {e}")
+            return specs
+        appended = set()
+        for mat in data_to.materials:
+            if mat is not None:
+                mat[PREWARM_PROP] = True
+                appended.add(mat.name)
+        print(f"Appended {len(appended)} materials from {library_path}")
+        return [spec for spec in specs if spec[0] not in appended]
+
+    def stop(self) -> None:
+        self.pending.clear()
+        if bpy.app.timers.is_registered(self._tick):
+            bpy.app.timers.unregister(self._tick)
+
+    def tick(self) -> Optional[float]:
+        """Timer callback: build materials until the per-tick budget is spent."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while self.pending and time.perf_counter() < deadline:
+            name, emission_strength, resource_kind, guid = self.pending.popleft()
+            if bpy.data.materials.get(name) is not None:
+                continue
+            mat = create_material(name, (1.0, 1.0, 1.0), emission_strength, resource_kind, guid)
+            mat[PREWARM_PROP] = True
+            self.created += 1
+        if self.pending:
+            return 0.05
+        print(f"Prewarmed {self.created} materials")
+        return None
+
+
+PREWARMER = MaterialPrewarmer()
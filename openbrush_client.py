@@ -0,0 +1,277 @@
+"""
+Non-blocking outbound client for the Open Brush API.
+
+All traffic to Open Brush runs on one background thread, so Blender's UI
+never waits on the network. Requests reuse keep-alive connections from a
+small pool. Dead connections are dropped and replaced transparently.
+
+The client:
+- registers the listener with retries and exponential backoff; retries are
+  scheduled between other jobs, so they never hold up command batches
+- sends periodic heartbeats, and re-registers when Open Brush comes back
+  after being unreachable
+- re-registers automatically when the listener restarts on our side
+- batches outgoing API commands (e.g. camera or scene sync): everything
+  queued since the last send goes out as one form-encoded POST, in order
+
+Jobs run in the order they were queued, which keeps command batches ordered.
+"""
+
+import http.client
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urlencode, quote
+
+API_HOST = "localhost"
+API_PORT = 40074
+API_PATH = "/api/v1"
+
+# Commands are (name, value) pairs as understood by the Open Brush API
+Command = Tuple[str, str]
+
+
+class ConnectionPool:
+    """Keep-alive HTTP connections to one host, reused across requests."""
+
+    def __init__(self, host: str, port: int, size: int = 2, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.idle = queue.LifoQueue(maxsize=size)
+
+    def request(self, method: str, path: str, body: Optional[str] = None,
+                headers: Optional[dict] = None) -> Tuple[int, bytes]:
+        """Send a request, retrying once on a stale pooled connection."""
+        for attempt in range(2):
+            try:
+                connection = self.idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+                reused = False
+            try:
+                connection.request(method, path, body, headers or {})
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                # A reused connection may have been closed by the server; retry on a fresh one
+                if reused and attempt == 0:
+                    continue
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    self.idle.put_nowait(connection)
+                except queue.Full:
+                    connection.close()
+            return response.status, data
+        raise ConnectionError("unreachable")
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class OpenBrushClient:
+    """Background-thread client for registration, heartbeats and command batches."""
+
+    def __init__(self, host: str = API_HOST, port: int = API_PORT, pool_size: int = 2,
+                 heartbeat_interval: float = 10.0, max_retries: int = 5, max_batch: int = 256):
+        self.pool = ConnectionPool(host, port, pool_size)
+        self.heartbeat_interval = heartbeat_interval
+        self.max_retries = max_retries
+        self.max_batch = max_batch
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending_commands: List[Tuple[Command, Optional[Callable]]] = []
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+        # Next registration attempt (monotonic time) while registering
+        self.register_at: Optional[float] = None
+        self.register_attempt = 0
+
+        self.listener_url: Optional[str] = None
+        self.status = 'idle'  # idle, registering, registered, unreachable, error
+        self.last_error = ''
+        self.reachable = False
+
+    # --- Public API, safe to call from the main thread ---
+
+    def start(self) -> None:
+        if self.thread is not None and self.thread.is_alive():
+            return
+        # Each thread gets its own stop event, so a thread that outlived
+        # stop()'s join (stuck in a request) still exits when it returns
+        self.stop_event = threading.Event()
+        self._drop_stop_sentinels()
+        self.thread = threading.Thread(target=self._run, args=(self.stop_event,),
+                                       name="OpenBrushClient", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None:
+            if self.thread.is_alive():
+                self.jobs.put(None)
+            self.thread.join(timeout=2.0)
+            self.thread = None
+        self.register_at = None
+        self.pool.close()
+
+    def _drop_stop_sentinels(self) -> None:
+        # A sentinel left over from an earlier stop() would end the new thread
+        with self.jobs.mutex:
+            kept = [job for job in self.jobs.queue if job is not None]
+            self.jobs.queue.clear()
+            self.jobs.queue.extend(kept)
+
+    def register(self, listener_url: str) -> None:
+        """Register the listener with Open Brush, retrying in the background."""
+        self.listener_url = listener_url
+        self.start()
+        self.jobs.put('register')
+
+    def on_listener_started(self, listener_url: str) -> None:
+        """Re-register after a listener restart if we were registered before."""
+        if self.listener_url is not None:
+            self.register(listener_url)
+
+    def send_commands(self, commands, callback: Optional[Callable] = None) -> None:
+        """Queue Open Brush API commands; they are sent in order, batched.
+
+        `commands` is a dict or a list of (name, value) pairs. `callback`, if
+        given, is called on the client thread with (status, body) or
+        (None, error message) once its batch has been sent."""
+        items = list(commands.items()) if isinstance(commands, dict) else list(commands)
+        self.start()
+        with self.lock:
+            for index, command in enumerate(items):
+                # Only the last command of a call carries its callback
+                self.pending_commands.append((command, callback if index == len(items) - 1 else None))
+        self.jobs.put('flush')
+
+    def get_status(self) -> dict:
+        with self.lock:
+            pending = len(self.pending_commands)
+        return {
+            'status': self.status,
+            'reachable': self.reachable,
+            'listener_url': self.listener_url,
+            'pending_commands': pending,
+            'last_error': self.last_error,
+        }
+
+    # --- Background thread ---
+
+    def _run(self, stop_event: threading.Event) -> None:
+        next_heartbeat = time.monotonic() + self.heartbeat_interval
+        while not stop_event.is_set():
+            # Timed work runs first, so a steady stream of batches can't starve it
+            now = time.monotonic()
+            if self.register_at is not None and self.register_at <= now:
+                job = 'register_attempt'
+            elif next_heartbeat <= now:
+                job = 'heartbeat'
+            else:
+                due = next_heartbeat if self.register_at is None else min(next_heartbeat, self.register_at)
+                try:
+                    job = self.jobs.get(timeout=due - now)
+                except queue.Empty:
+                    continue
+            if job is None or stop_event.is_set():
+                if job in ('register', 'flush'):
+                    self.jobs.put(job)  # Leave it for the thread that replaced us
+                break
+            try:
+                if job == 'register':
+                    self._schedule_register()
+                elif job == 'register_attempt':
+                    self._register_attempt()
+                elif job == 'flush':
+                    self._flush(stop_event)
+                elif job == 'heartbeat':
+                    self._heartbeat()
+                    next_heartbeat = time.monotonic() + self.heartbeat_interval
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Open Brush client error: {e}")
+
+    def _schedule_register(self) -> None:
+        """Start a registration cycle; the first attempt runs right away."""
+        if self.listener_url is None:
+            return
+        self.status = 'registering'
+        self.register_attempt = 0
+        self.register_at = time.monotonic()
+
+    def _register_attempt(self) -> None:
+        url = self.listener_url
+        self.register_at = None
+        if url is None:
+            return
+        path = f"{API_PATH}?listenfor.strokes={quote(url, safe=':/')}"
+        try:
+            status, _ = self.pool.request('GET', path)
+        except (OSError, http.client.HTTPException, ConnectionError) as e:
+            self.reachable = False
+            self.last_error = f"Failed to connect to Open Brush: {e}"
+        else:
+            self.reachable = True
+            if status == 200:
+                self.status = 'registered'
+                self.last_error = ''
+                print("Successfully registered with Open Brush")
+                return
+            self.last_error = f"Open Brush responded with status {status}"
+
+        self.register_attempt += 1
+        if self.register_attempt < self.max_retries:
+            # Exponential backoff: 0.5s, 1s, 2s, ... capped at 8s
+            self.register_at = time.monotonic() + min(0.5 * 2 ** (self.register_attempt - 1), 8.0)
+            return
+        self.status = 'unreachable' if not self.reachable else 'error'
+        print(f"Registration with Open Brush failed: {self.last_error}")
+
+    def _heartbeat(self) -> None:
+        if self.listener_url is None:
+            return
+        was_reachable = self.reachable
+        try:
+            self.pool.request('GET', API_PATH)
+        except (OSError, http.client.HTTPException, ConnectionError) as e:
+            self.reachable = False
+            self.last_error = f"Open Brush unreachable: {e}"
+            if self.status == 'registered':
+                self.status = 'unreachable'
+            return
+        self.reachable = True
+        if self.register_at is None and (not was_reachable or self.status != 'registered'):
+            # Open Brush came back (or never accepted us): register again
+            self._schedule_register()
+
+    def _flush(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            with self.lock:
+                batch = self.pending_commands[:self.max_batch]
+                del self.pending_commands[:self.max_batch]
+            if not batch:
+                return
+            body = urlencode([command for command, _ in batch])
+            try:
+                result = self.pool.request('POST', API_PATH, body,
+                                           {'Content-Type': 'application/x-www-form-urlencoded'})
+                self.reachable = True
+            except (OSError, http.client.HTTPException, ConnectionError) as e:
+                self.reachable = False
+                self.last_error = f"Failed to send commands: {e}"
+                result = (None, str(e))
+            for _, callback in batch:
+                if callback is not None:
+                    callback(*result)
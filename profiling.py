@@ -0,0 +1,144 @@
+"""
+On-demand profiler capture for the stroke pipeline.
+
+A capture is requested (from the panel or over HTTP) for the next N timer
+ticks or seconds. While it runs, cProfile is enabled around each timer tick
+on the main thread and the per-stage timers wrapped around the pipeline
+steps accumulate wall time. When the capture ends, the cProfile data is
+written as a .prof file and the stage timings as JSON under the cache
+directory, and a short top-N summary is kept for the panel.
+
+Outside a capture the stage timers cost one attribute check.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from typing import List, Optional
+
+SUMMARY_SIZE = 8
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'PipelineProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_stage_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class PipelineProfiler:
+    """Collects cProfile data and per-stage timings for a bounded capture."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = False
+        self.requested = None  # (ticks, seconds) waiting for the next tick
+        self.profile: Optional[cProfile.Profile] = None
+        self.remaining_ticks: Optional[int] = None
+        self.deadline: Optional[float] = None
+        self.stage_times = {}
+        self.stage_counts = {}
+        self.summary: List[str] = []
+        self.last_output: Optional[str] = None
+
+    def request_capture(self, ticks: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        """Ask for a capture to start on the next tick. Safe from any thread."""
+        if ticks is None and seconds is None:
+            ticks = 50
+        with self.lock:
+            self.requested = (ticks, seconds)
+
+    def stage(self, name: str):
+        """Context manager timing one pipeline stage while a capture runs."""
+        if not self.active:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def add_stage_time(self, name: str, seconds: float) -> None:
+        self.stage_times[name] = self.stage_times.get(name, 0.0) + seconds
+        self.stage_counts[name] = self.stage_counts.get(name, 0) + 1
+
+    def begin_tick(self) -> None:
+        """Called at the start of each timer tick on the main thread."""
+        if not self.active:
+            with self.lock:
+                requested, self.requested = self.requested, None
+            if requested is None:
+                return
+            ticks, seconds = requested
+            self.remaining_ticks = ticks
+            self.deadline = time.monotonic() + seconds if seconds is not None else None
+            self.stage_times = {}
+            self.stage_counts = {}
+            self.profile = cProfile.Profile()
+            self.active = True
+            print(f"Profiler capture started (ticks={ticks}, seconds={seconds})")
+        self.profile.enable()
+
+    def end_tick(self, cache_dir: str) -> None:
+        """Called at the end of each timer tick; finishes the capture when due."""
+        if not self.active:
+            return
+        self.profile.disable()
+        if self.remaining_ticks is not None:
+            self.remaining_ticks -= 1
+        if (self.remaining_ticks is not None and self.remaining_ticks <= 0) or \
+           (self.deadline is not None and time.monotonic() >= self.deadline):
+            self.active = False
+            self._finish(cache_dir)
+
+    def _finish(self, cache_dir: str) -> None:
+        out_dir = os.path.join(cache_dir, "profiles")
+        os.makedirs(out_dir, exist_ok=True)
+        base = os.path.join(out_dir, time.strftime("pipeline_%Y%m%d_%H%M%S"))
+
+        self.profile.dump_stats(base + ".prof")
+        with open(base + "_stages.json", 'w') as f:
+            json.dump({name: {'seconds': self.stage_times[name], 'calls': self.stage_counts[name]}
+                       for name in self.stage_times}, f, indent=2)
+
+        summary = [f"{name}: {seconds * 1000:.1f} ms / {self.stage_counts[name]}"
+                   for name, seconds in sorted(self.stage_times.items(), key=lambda kv: -kv[1])]
+        stats = pstats.Stats(self.profile)
+        top = sorted(stats.stats.items(), key=lambda item: -item[1][3])[:SUMMARY_SIZE]
+        for (filename, line, func), (_, _, _, cumtime, _) in top:
+            summary.append(f"{func} ({os.path.basename(filename)}:{line}) {cumtime * 1000:.1f} ms")
+
+        self.summary = summary
+        self.last_output = base + ".prof"
+        self.profile = None
+        print(f"Profiler capture written to {self.last_output}")
+
+    def status(self) -> dict:
+        return {
+            'active': self.active,
+            'pending': self.requested is not None,
+            'output': self.last_output,
+            'summary': self.summary,
+        }
+
+
+PROFILER = PipelineProfiler()
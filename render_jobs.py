@@ -0,0 +1,214 @@
+"""
+Background render jobs.
+
+Render requests arriving on the HTTP thread only create a job record and
+return its ID. The main-thread timer saves a snapshot .blend of the current
+scene for each pending job and hands it to a pool of worker threads, each
+of which drives a headless `blender -b` subprocess and parses its output
+for progress. Live stroke ingest keeps running while renders progress.
+"""
+
+import bpy
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+_FRAME_SAVED = re.compile(r"^Saved: ")
+_FRAME_RENDERING = re.compile(r"^Fra:(\d+)")
+
+
+@dataclass
+class RenderJob:
+    """State of one background render, as reported over HTTP."""
+    id: str
+    status: str = 'pending'  # pending, queued, running, done, failed, cancelled
+    frame_start: Optional[int] = None
+    frame_end: Optional[int] = None
+    current_frame: Optional[int] = None
+    frames_done: int = 0
+    progress: float = 0.0
+    blend_path: Optional[str] = None
+    output_path: Optional[str] = None
+    returncode: Optional[int] = None
+    message: str = ''
+    created: float = field(default_factory=time.time)
+    finished: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class RenderJobManager:
+    """Tracks render jobs and runs them in a pool of Blender subprocesses."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.pending = queue.Queue()  # Jobs waiting for a main-thread snapshot
+        self.work_queue = queue.Queue()  # Jobs ready for a worker
+        self.workers = []
+        self.processes = {}
+
+    def submit(self, params: Optional[dict] = None) -> RenderJob:
+        """Create a job. Safe to call from any thread."""
+        params = params or {}
+        job = RenderJob(id=uuid.uuid4().hex[:12])
+        if 'frame_start' in params:
+            job.frame_start = int(params['frame_start'])
+        if 'frame_end' in params:
+            job.frame_end = int(params['frame_end'])
+        with self.lock:
+            self.jobs[job.id] = job
+        self.pending.put(job)
+        return job
+
+    def get_status(self, job_id: Optional[str] = None):
+        with self.lock:
+            if job_id is not None:
+                job = self.jobs.get(job_id)
+                return job.to_dict() if job else None
+            return [job.to_dict() for job in self.jobs.values()]
+
+    def counts(self) -> dict:
+        result = {}
+        with self.lock:
+            for job in self.jobs.values():
+                result[job.status] = result.get(job.status, 0) + 1
+        return result
+
+    def cancel(self, job_id: str) -> bool:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status in ('done', 'failed', 'cancelled'):
+                return False
+            job.status = 'cancelled'
+            process = self.processes.get(job_id)
+        if process is not None:
+            process.terminate()
+        return True
+
+    def process_pending(self, cache_dir: str, pool_size: int) -> None:
+        """Snapshot pending jobs and queue them for the pool. Main thread only."""
+        while True:
+            try:
+                job = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            if job.status == 'cancelled':
+                continue
+            try:
+                self._snapshot(job, cache_dir)
+            except Exception as e:
+                print(f"Render job {job.id} snapshot failed: {e}")
+                with self.lock:
+                    job.status = 'failed'
+                    job.message = str(e)
+                    job.finished = time.time()
+                continue
+            self._ensure_workers(pool_size)
+            with self.lock:
+                job.status = 'queued'
+            self.work_queue.put(job)
+
+    def _snapshot(self, job: RenderJob, cache_dir: str) -> None:
+        scene = bpy.context.scene
+        if job.frame_start is None:
+            job.frame_start = scene.frame_start
+        if job.frame_end is None:
+            job.frame_end = scene.frame_end
+
+        job_dir = os.path.join(cache_dir, "renders", job.id)
+        os.makedirs(job_dir, exist_ok=True)
+        job.blend_path = os.path.join(job_dir, "snapshot.blend")
+        job.output_path = os.path.join(job_dir, "frame_####")
+        bpy.ops.wm.save_as_mainfile(filepath=job.blend_path, copy=True, check_existing=False)
+
+    def _ensure_workers(self, pool_size: int) -> None:
+        self.workers = [w for w in self.workers if w.is_alive()]
+        while len(self.workers) < max(1, pool_size):
+            worker = threading.Thread(target=self._worker, daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def _worker(self) -> None:
+        while True:
+            job = self.work_queue.get()
+            if job is None:
+                return
+            if job.status == 'cancelled':
+                continue
+            try:
+                self._run(job)
+            except Exception as e:
+                # Keep the worker alive and never leave a job stuck in 'running'
+                print(f"Render job {job.id} failed: {e}")
+                with self.lock:
+                    process = self.processes.pop(job.id, None)
+                    if job.status != 'cancelled':
+                        job.status = 'failed'
+                        job.message = str(e)
+                    job.finished = time.time()
+                if process is not None and process.poll() is None:
+                    process.kill()
+
+    def _run(self, job: RenderJob) -> None:
+        command = [
+            bpy.app.binary_path, "-b", job.blend_path,
+            "-o", job.output_path,
+            "-s", str(job.frame_start), "-e", str(job.frame_end),
+            "-a",
+        ]
+        total = max(1, job.frame_end - job.frame_start + 1)
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       text=True, errors='replace', bufsize=1)
+        except OSError as e:
+            with self.lock:
+                job.status = 'failed'
+                job.message = str(e)
+                job.finished = time.time()
+            return
+
+        with self.lock:
+            self.processes[job.id] = process
+            cancelled = job.status == 'cancelled'
+            if not cancelled:
+                job.status = 'running'
+        if cancelled:
+            # cancel() ran between dequeue and registering the process
+            process.terminate()
+
+        for line in process.stdout:
+            match = _FRAME_RENDERING.match(line)
+            with self.lock:
+                if match:
+                    job.current_frame = int(match.group(1))
+                elif _FRAME_SAVED.match(line):
+                    job.frames_done += 1
+                    job.progress = min(1.0, job.frames_done / total)
+        process.wait()
+
+        with self.lock:
+            self.processes.pop(job.id, None)
+            job.returncode = process.returncode
+            job.finished = time.time()
+            if job.status != 'cancelled':
+                job.status = 'done' if process.returncode == 0 else 'failed'
+                if job.status == 'done':
+                    job.progress = 1.0
+
+    def shutdown(self) -> None:
+        """Stop the pool and terminate running renders."""
+        with self.lock:
+            processes = list(self.processes.values())
+        for process in processes:
+            process.terminate()
+        for _ in self.workers:
+            self.work_queue.put(None)
+        self.workers = []
@@ -0,0 +1,221 @@
+"""
+Datablock and memory accounting for long sessions.
+
+The consumers report every datablock and point they create to the
+module-level TRACKER, which keeps per-consumer counters and an approximate
+byte estimate. Counters are exposed in the panel and on the /metrics route.
+This module also provides orphan cleanup and consolidation of per-stroke
+curve objects, which are used by the purge operator and by the soft limits.
+"""
+
+import bpy
+import threading
+import numpy as np
+from typing import Dict, List
+
+from .lod import LOD_PROP
+
+PREFIX = "OpenBrush"
+# Curve data name of objects created by consolidate_curves()
+MERGED_NAME = "OpenBrushStrokes"
+
+# Rough in-memory sizes, good enough for trend monitoring
+BYTES_PER_POINT = {
+    'GREASE_PENCIL': 36,  # position, radius, opacity, vertex color
+    'CURVE': 40,          # 4D co, radius, tilt, weight, flags
+}
+BYTES_PER_DATABLOCK = {
+    'objects': 1536,
+    'curves': 1024,
+    'grease_pencils': 2048,
+    'materials': 16384,  # includes the default node tree
+    'collections': 512,
+}
+
+
+class ResourceTracker:
+    """Per-consumer counters of datablocks, points and approximate bytes."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.consumers: Dict[str, dict] = {}
+        self.warned: set = set()
+
+    def _entry(self, consumer: str) -> dict:
+        entry = self.consumers.get(consumer)
+        if entry is None:
+            entry = {'datablocks': {}, 'points': 0, 'strokes': 0}
+            self.consumers[consumer] = entry
+        return entry
+
+    def add_datablocks(self, consumer: str, kind: str, count: int = 1) -> None:
+        with self.lock:
+            blocks = self._entry(consumer)['datablocks']
+            blocks[kind] = max(0, blocks.get(kind, 0) + count)
+
+    def add_stroke(self, consumer: str, points: int) -> None:
+        with self.lock:
+            entry = self._entry(consumer)
+            entry['points'] += points
+            entry['strokes'] += 1
+
+    def metrics(self) -> dict:
+        """Snapshot of all counters; safe to call from any thread."""
+        with self.lock:
+            result = {}
+            totals = {'datablocks': 0, 'points': 0, 'strokes': 0, 'approx_bytes': 0}
+            for consumer, entry in self.consumers.items():
+                approx = entry['points'] * BYTES_PER_POINT.get(consumer, 40)
+                approx += sum(BYTES_PER_DATABLOCK.get(kind, 1024) * count
+                              for kind, count in entry['datablocks'].items())
+                result[consumer] = {
+                    'datablocks': dict(entry['datablocks']),
+                    'points': entry['points'],
+                    'strokes': entry['strokes'],
+                    'approx_bytes': approx,
+                }
+                totals['datablocks'] += sum(entry['datablocks'].values())
+                totals['points'] += entry['points']
+                totals['strokes'] += entry['strokes']
+                totals['approx_bytes'] += approx
+            result['total'] = totals
+            return result
+
+    def check_limits(self, point_limit: int, datablock_limit: int) -> List[str]:
+        """Names of soft limits that are newly exceeded (0 disables a limit)."""
+        totals = self.metrics()['total']
+        exceeded = []
+        for name, value, limit in (('points', totals['points'], point_limit),
+                                   ('datablocks', totals['datablocks'], datablock_limit)):
+            if limit and value > limit:
+                if name not in self.warned:
+                    exceeded.append(name)
+                    self.warned.add(name)
+            else:
+                self.warned.discard(name)
+        return exceeded
+
+    def rescan(self) -> None:
+        """Rebuild datablock and point counters from bpy.data."""
+        gp = {'datablocks': {}, 'points': 0, 'strokes': 0}
+        curve = {'datablocks': {}, 'points': 0, 'strokes': 0}
+        for obj in bpy.data.objects:
+            if obj.type == 'GREASEPENCIL' and obj.name.startswith(PREFIX):
+                gp['datablocks']['objects'] = gp['datablocks'].get('objects', 0) + 1
+            elif obj.type == 'CURVE' and obj.name.startswith(PREFIX):
+                curve['datablocks']['objects'] = curve['datablocks'].get('objects', 0) + 1
+        for data in bpy.data.grease_pencils:
+            if data.name.startswith(PREFIX):
+                gp['datablocks']['grease_pencils'] = gp['datablocks'].get('grease_pencils', 0) + 1
+                for layer in data.layers:
+                    for frame in layer.frames:
+                        gp['points'] += len(frame.drawing.attributes['position'].data)
+                        gp['strokes'] += len(frame.drawing.strokes)
+        for data in bpy.data.curves:
+            if data.name.startswith(PREFIX):
+                curve['datablocks']['curves'] = curve['datablocks'].get('curves', 0) + 1
+                for spline in data.splines:
+                    curve['points'] += len(spline.points)
+                    curve['strokes'] += 1
+        for mat in bpy.data.materials:
+            target = gp if mat.name.startswith("OpenBrushGP_") else curve if mat.name.startswith("OpenBrushCurve_") else None
+            if target is not None:
+                target['datablocks']['materials'] = target['datablocks'].get('materials', 0) + 1
+        with self.lock:
+            self.consumers = {'GREASE_PENCIL': gp, 'CURVE': curve}
+
+
+TRACKER = ResourceTracker()
+
+
+def purge_orphans() -> int:
+    """Remove OpenBrush curves, Grease Pencil data and materials with no users.
+    Prewarmed materials that have not been used yet are kept."""
+    from .materials import PREWARM_PROP  # materials imports this module
+    removed = 0
+    for collection in (bpy.data.curves, bpy.data.grease_pencils, bpy.data.materials):
+        for block in list(collection):
+            if block.name.startswith(PREFIX) and block.users == 0 and not block.get(PREWARM_PROP):
+                collection.remove(block)
+                removed += 1
+    return removed
+
+
+def _consolidation_key(obj: bpy.types.Object):
+    mat = obj.data.materials[0] if obj.data.materials else None
+    return obj.users_collection[0].name, obj.get(LOD_PROP), mat.name if mat else None
+
+
+def _new_merged_object(collection_name: str, level, mat_name, like: bpy.types.Object) -> bpy.types.Object:
+    merged = bpy.data.curves.new(name=MERGED_NAME, type='CURVE')
+    merged.dimensions = '3D'
+    merged.bevel_depth = 1.0
+    merged.bevel_resolution = 4
+    if mat_name:
+        merged.materials.append(bpy.data.materials[mat_name])
+
+    merged_obj = bpy.data.objects.new(MERGED_NAME, merged)
+    # The scene's master collection is not part of bpy.data.collections
+    collection = bpy.data.collections.get(collection_name) or bpy.context.scene.collection
+    collection.objects.link(merged_obj)
+    if level is not None:
+        merged_obj[LOD_PROP] = level
+        merged_obj.hide_viewport = like.hide_viewport
+        merged_obj.hide_render = like.hide_render
+    return merged_obj
+
+
+def consolidate_curves() -> int:
+    """Merge per-stroke curve objects that share a collection, material and LOD
+    level into one object each. Returns the number of objects removed.
+
+    New strokes are appended to the group's existing merged object, so each
+    run only touches strokes created since the last one. Each stroke's bevel
+    depth is folded into its point radii so the merged object keeps stroke
+    thickness with a bevel depth of 1."""
+    groups = {}
+    merged_objects = {}
+    for obj in bpy.data.objects:
+        if obj.type != 'CURVE' or not obj.users_collection:
+            continue
+        if obj.data.name.startswith(MERGED_NAME):
+            merged_objects.setdefault(_consolidation_key(obj), obj)
+        elif obj.data.name.startswith("OpenBrushStroke"):
+            groups.setdefault(_consolidation_key(obj), []).append(obj)
+
+    removed = 0
+    for key, objects in groups.items():
+        merged_obj = merged_objects.get(key)
+        if merged_obj is None:
+            if len(objects) < 2:
+                continue
+            merged_obj = _new_merged_object(*key, objects[0])
+            removed -= 1
+        merged = merged_obj.data
+        to_merged = np.linalg.inv(np.array(merged_obj.matrix_world, dtype=np.float64)).astype(np.float32)
+
+        for obj in objects:
+            matrix = to_merged @ np.array(obj.matrix_world, dtype=np.float32)
+            bevel = obj.data.bevel_depth
+            for spline in obj.data.splines:
+                count = len(spline.points)
+                co = np.empty(count * 4, dtype=np.float32)
+                radius = np.empty(count, dtype=np.float32)
+                spline.points.foreach_get('co', co)
+                spline.points.foreach_get('radius', radius)
+                co = co.reshape(count, 4)
+                co[:, :3] = co[:, :3] @ matrix[:3, :3].T + matrix[:3, 3]
+
+                target = merged.splines.new(type='POLY')
+                target.points.add(count - 1)
+                target.points.foreach_set('co', co.ravel())
+                target.points.foreach_set('radius', radius * bevel)
+
+        for obj in objects:
+            data = obj.data
+            bpy.data.objects.remove(obj)
+            if data.users == 0:
+                bpy.data.curves.remove(data)
+        removed += len(objects)
+
+    return removed
@@ -0,0 +1,117 @@
+"""
+Sequence-numbered ingest with a bounded reorder buffer.
+
+Stroke commands are stateful: `brush.type` and `color.set.rgb` must be
+applied before the `draw.stroke` they belong to. Producers that send over
+several connections or in parallel can tag each request with a source ID
+and a per-source sequence number (the X-OpenBrush-Source / X-OpenBrush-Seq
+headers). The listener queues those requests as SequencedCommands and the
+consumer runs them through a ReorderBuffer, which releases commands in
+sequence order and drops retransmitted duplicates. Released commands run
+with their source's own brush, size and color state, so sources never
+apply their brush to each other's strokes.
+
+Sequence numbers start at FIRST_SEQ for every source; a producer that
+restarts must use a new source ID. A gap is assumed lost and skipped when
+more than `capacity` requests wait behind it, or when it has blocked its
+source for `gap_timeout` seconds. The consumer calls expire() every tick so
+the last requests of a session are released even if nothing else arrives.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+SOURCE_HEADER = "X-OpenBrush-Source"
+SEQ_HEADER = "X-OpenBrush-Seq"
+FIRST_SEQ = 0
+
+
+@dataclass
+class SourcedCommands:
+    """Commands from one producer, applied together with that producer's own
+    brush, size and color state. `end` marks a closed connection whose
+    state can be dropped."""
+    source: Optional[str]
+    commands: list
+    end: bool = False
+
+
+@dataclass
+class SequencedCommands:
+    """Commands from one request, tagged with their source and sequence number."""
+    source: str
+    seq: int
+    commands: list
+
+
+class ReorderBuffer:
+    """Releases sequenced commands in per-source order."""
+
+    def __init__(self, capacity: int = 256, gap_timeout: float = 2.0):
+        self.capacity = capacity
+        self.gap_timeout = gap_timeout
+        self.lock = threading.Lock()
+        self.next_seq: Dict[str, int] = {}
+        self.pending: Dict[str, Dict[int, list]] = {}
+        self.blocked_since: Dict[str, float] = {}
+        self.duplicates = 0
+        self.gaps_skipped = 0
+
+    def push(self, item: SequencedCommands, now: Optional[float] = None) -> List[object]:
+        """Add an item and return the commands that are now ready, in order."""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            expected = self.next_seq.get(item.source, FIRST_SEQ)
+            pending = self.pending.setdefault(item.source, {})
+
+            if item.seq < expected or item.seq in pending:
+                self.duplicates += 1
+                return []
+            pending[item.seq] = item.commands
+            return self._release(item.source, now)
+
+    def expire(self, now: Optional[float] = None) -> List[SourcedCommands]:
+        """Skip gaps that have blocked a source for longer than gap_timeout and
+        return the commands released by doing so, grouped by source."""
+        now = time.monotonic() if now is None else now
+        ready = []
+        with self.lock:
+            for source, since in list(self.blocked_since.items()):
+                if now - since >= self.gap_timeout:
+                    ready.append(SourcedCommands(source, self._release(source, now, skip_gap=True)))
+        return ready
+
+    def _release(self, source: str, now: float, skip_gap: bool = False) -> List[object]:
+        pending = self.pending[source]
+        start = expected = self.next_seq.get(source, FIRST_SEQ)
+        ready = []
+        while True:
+            while expected in pending:
+                ready.extend(pending.pop(expected))
+                expected += 1
+            if not pending or (len(pending) <= self.capacity and not skip_gap):
+                break
+            # Too much, or too long, waiting on a missing request; give up on it
+            skip_to = min(pending)
+            self.gaps_skipped += skip_to - expected
+            expected = skip_to
+            skip_gap = False
+
+        self.next_seq[source] = expected
+        if not pending:
+            self.blocked_since.pop(source, None)
+        elif expected != start or source not in self.blocked_since:
+            # A new gap starts blocking the source now
+            self.blocked_since[source] = now
+        return ready
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                'sources': len(self.next_seq),
+                'waiting': sum(len(p) for p in self.pending.values()),
+                'duplicates': self.duplicates,
+                'gaps_skipped': self.gaps_skipped,
+            }
@@ -0,0 +1,125 @@
+"""
+Spatial partitioning of incoming strokes into a uniform 3D grid.
+
+Each stroke is bucketed by the centre of its bounding box, so every stroke
+lands in exactly one cell. Cells map to a Grease Pencil layer or a child
+collection named after the cell index, which can then be hidden, excluded
+from the view layer or linked independently.
+
+The cell size (in millimetres) is part of the key and the name, e.g.
+OpenBrushChunk_1_0_-2_2000mm. Changing Chunk Size mid-session therefore
+starts new cells instead of mixing sizes, and culling measures every chunk
+in its own cell size.
+"""
+
+import bpy
+import numpy as np
+from typing import Optional, Tuple
+
+CHUNK_PREFIX = "OpenBrushChunk"
+
+# Cell index x, y, z and the cell size in millimetres
+ChunkKey = Tuple[int, int, int, int]
+
+
+def path_to_blender_positions(path) -> np.ndarray:
+    """Return an (N, 3) array of Blender-space positions for an Open Brush path.
+    Unity: X, Y, Z → Blender: X, Z, Y"""
+    points = np.asarray(path, dtype=np.float32)
+    return points[:, (0, 2, 1)]
+
+
+def path_bounds(path) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized bounding box of a path in Blender coordinates."""
+    positions = path_to_blender_positions(path)
+    return positions.min(axis=0), positions.max(axis=0)
+
+
+def cell_size_mm(cell_size: float) -> int:
+    return max(1, int(round(cell_size * 1000)))
+
+
+def cell_index(position, size_mm: int) -> Tuple[int, int, int]:
+    """Grid cell index containing a Blender-space position."""
+    return tuple(int(i) for i in np.floor(np.asarray(position) / (size_mm / 1000.0)))
+
+
+def chunk_key(path, cell_size: float) -> ChunkKey:
+    """Grid cell containing the centre of the path's bounding box."""
+    lo, hi = path_bounds(path)
+    size_mm = cell_size_mm(cell_size)
+    return (*cell_index((lo + hi) * 0.5, size_mm), size_mm)
+
+
+def chunk_name(key: ChunkKey) -> str:
+    return f"{CHUNK_PREFIX}_{key[0]}_{key[1]}_{key[2]}_{key[3]}mm"
+
+
+def parse_chunk_name(name: str) -> Optional[ChunkKey]:
+    """Inverse of chunk_name; returns None for names that are not chunks."""
+    if not name.startswith(CHUNK_PREFIX + "_"):
+        return None
+    try:
+        x, y, z, size = name[len(CHUNK_PREFIX) + 1:].split('.')[0].split('_')
+        if not size.endswith('mm'):
+            return None
+        return int(x), int(y), int(z), int(size[:-2])
+    except ValueError:
+        return None
+
+
+def get_chunk_collection(parent: bpy.types.Collection, key: ChunkKey) -> bpy.types.Collection:
+    """Get or create the child collection holding a grid cell."""
+    name = chunk_name(key)
+    collection = parent.children.get(name)
+    if collection is None:
+        collection = bpy.data.collections.get(name)
+        if collection is None:
+            collection = bpy.data.collections.new(name)
+        parent.children.link(collection)
+    return collection
+
+
+def cells_within(key: ChunkKey, position, radius: int) -> bool:
+    """True if a chunk lies within `radius` of its own cells (Chebyshev
+    distance) from the cell containing `position`."""
+    centre = cell_index(position, key[3])
+    return max(abs(a - b) for a, b in zip(key[:3], centre)) <= radius
+
+
+def cull_chunks(context, radius: int) -> Tuple[int, int]:
+    """Show only chunks within `radius` cells of the 3D cursor.
+
+    Chunk collections are excluded from the active view layer and Grease
+    Pencil chunk layers are hidden. Returns (visible, hidden) counts.
+    """
+    centre = context.scene.cursor.location
+    visible = hidden = 0
+
+    def visit(layer_collection):
+        nonlocal visible, hidden
+        for child in layer_collection.children:
+            key = parse_chunk_name(child.name)
+            if key is not None:
+                show = cells_within(key, centre, radius)
+                child.exclude = not show
+                visible += show
+                hidden += not show
+            else:
+                visit(child)
+
+    visit(context.view_layer.layer_collection)
+
+    for obj in bpy.data.objects:
+        if obj.type != 'GREASEPENCIL':
+            continue
+        for layer in obj.data.layers:
+            key = parse_chunk_name(layer.name)
+            if key is None:
+                continue
+            show = cells_within(key, centre, radius)
+            layer.hide = not show
+            visible += show
+            hidden += not show
+
+    return visible, hidden
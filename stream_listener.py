@@ -0,0 +1,104 @@
+"""
+Persistent length-prefixed TCP channel for high-rate stroke streaming.
+
+Producers keep one connection open and send frames (see wire_format) with
+no per-message response. Frames from a connection are decoded and queued in
+the order they arrive, on the connection's own thread, so ordering within a
+connection is preserved. Each frame is queued as one SourcedCommands item
+carrying the connection's own brush state, so producers connected at the
+same time cannot interleave their brush, color and stroke commands.
+Commands land in the same queue the HTTP listener feeds. Stopping the server also
+shuts down open connections, so nothing is queued after "Stop Listener".
+"""
+
+import queue
+import socket
+import socketserver
+import threading
+from typing import Optional, Tuple
+
+from .wire_format import FrameReader, decode_frame, WireFormatError
+from .sequencing import SourcedCommands
+
+RECV_SIZE = 256 * 1024
+
+
+class StreamRequestHandler(socketserver.BaseRequestHandler):
+    """Reads frames from one producer connection until it closes."""
+
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = FrameReader()
+        server = self.server
+        source = f"stream:{self.client_address[0]}:{self.client_address[1]}"
+        if not server.add_connection(self.request):
+            return
+        try:
+            while True:
+                data = self.request.recv(RECV_SIZE)
+                if not data:
+                    break
+                for kind, payload in reader.feed(data):
+                    commands = decode_frame(kind, payload)
+                    if server.stopping.is_set():
+                        return
+                    server.command_queue.put(SourcedCommands(source, commands))
+        except (WireFormatError, ValueError) as e:
+            print(f"Stream error from {self.client_address}: {e}")
+        except OSError:
+            pass
+        finally:
+            server.remove_connection(self.request)
+            server.command_queue.put(SourcedCommands(source, [], end=True))
+
+
+class StreamServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, command_queue: queue.Queue):
+        super().__init__(address, StreamRequestHandler)
+        self.command_queue = command_queue
+        self.stopping = threading.Event()
+        self.connections_lock = threading.Lock()
+        self.connections = set()
+
+    def add_connection(self, connection: socket.socket) -> bool:
+        """Track an open connection; refused once the server is stopping."""
+        with self.connections_lock:
+            if self.stopping.is_set():
+                return False
+            self.connections.add(connection)
+            return True
+
+    def remove_connection(self, connection: socket.socket) -> None:
+        with self.connections_lock:
+            self.connections.discard(connection)
+
+    def close_connections(self) -> None:
+        """Stop queueing and shut down every open producer connection."""
+        with self.connections_lock:
+            self.stopping.set()
+            connections = list(self.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def start_stream_server(port: int, command_queue: queue.Queue) -> Tuple[StreamServer, threading.Thread]:
+    server = StreamServer(("", port), command_queue)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def stop_stream_server(server: Optional[StreamServer], thread: Optional[threading.Thread]) -> None:
+    if server is None:
+        return
+    server.shutdown()
+    server.close_connections()
+    server.server_close()
+    if thread is not None:
+        thread.join()
@@ -2,36 +2,107 @@ import bpy
 import queue
 import json
 from typing import Optional
+from .spatial_chunks import chunk_key, ChunkKey
+from .profiling import PROFILER
+from .sequencing import ReorderBuffer, SequencedCommands, SourcedCommands
+
+# Per-producer stroke state, swapped in when that producer's commands run
+SOURCE_STATE = ('current_color', 'current_brush', 'current_brush_size')
 
 class BaseStrokeConsumer:
 
-    """Base class for consuming stroke commands from a queue."""
-    def __init__(self, stroke_queue: queue.Queue):
+    """Base class for consuming stroke commands from a queue.
+
+    Besides the queue fed by the network listeners, a consumer polls any
+    number of command sources: objects with a `poll()` method returning the
+    commands that arrived since the last call, e.g. the local Unix socket.
+    Sequence-numbered commands pass through the reorder buffer first; gaps
+    that have timed out are skipped at the end of each pass.
+
+    Commands wrapped in SourcedCommands run with their producer's own brush,
+    size and color, so producers connected at the same time never apply
+    their brush to each other's strokes. Plain commands share the default
+    state, as Open Brush's one-command HTTP requests always have."""
+    def __init__(self, stroke_queue: queue.Queue, command_sources: Optional[list] = None,
+                 reorder_buffer: Optional[ReorderBuffer] = None):
         self.stroke_queue = stroke_queue
+        self.command_sources = command_sources if command_sources is not None else []
+        self.reorder_buffer = reorder_buffer if reorder_buffer is not None else ReorderBuffer()
         self.current_color: tuple = (1.0, 1.0, 1.0)
         self.current_brush: Optional[str] = None
         self.current_brush_size: float = 1.0
         self.current_path: Optional[list] = None
         self.path_ready: bool = False
+        self.active_source: Optional[str] = None
+        self.source_states: dict = {}
 
     def process_queue(self) -> None:
-        """Process all commands in the queue."""
+        """Process all commands in the queue, then those from each command source."""
         try:
             while True:
-                command = self.stroke_queue.get_nowait()
-                self.decode_command(command)
-                if self.path_ready:
-                    self.process_current_path()
-                    self.path_ready = False
+                self.consume(self.stroke_queue.get_nowait())
         except queue.Empty:
             pass
+        for source in self.command_sources:
+            for command in source.poll():
+                self.consume(command)
+        for command in self.reorder_buffer.expire():
+            self.consume(command)
+
+    def consume(self, command) -> None:
+        """Apply one command and create the stroke if it completed a path."""
+        if isinstance(command, SequencedCommands):
+            self.consume_from(command.source, self.reorder_buffer.push(command))
+            return
+        if isinstance(command, SourcedCommands):
+            self.consume_from(command.source, command.commands)
+            if command.end:
+                self.drop_source(command.source)
+            return
+        with PROFILER.stage('decode_command'):
+            self.decode_command(command)
+        if self.path_ready:
+            with PROFILER.stage('process_current_path'):
+                self.process_current_path()
+            self.path_ready = False
+
+    def consume_from(self, source: Optional[str], commands) -> None:
+        """Apply commands using the stroke state of `source`."""
+        self.use_source(source)
+        try:
+            for command in commands:
+                self.consume(command)
+        finally:
+            self.use_source(None)
 
-    def decode_command(self, command: str) -> None:
-        """Decode a single command string and update state."""
-        parts = command.split('=', 1)
-        if len(parts) != 2:
+    def use_source(self, source: Optional[str]) -> None:
+        """Save the active producer's stroke state and load that of `source`."""
+        if source == self.active_source:
             return
-        key, value = parts
+        self.source_states[self.active_source] = tuple(getattr(self, name) for name in SOURCE_STATE)
+        state = self.source_states.get(source)
+        if state is None:
+            state = ((1.0, 1.0, 1.0), None, 1.0)
+        for name, value in zip(SOURCE_STATE, state):
+            setattr(self, name, value)
+        self.active_source = source
+
+    def drop_source(self, source: Optional[str]) -> None:
+        if source is not None and source != self.active_source:
+            self.source_states.pop(source, None)
+
+    def decode_command(self, command) -> None:
+        """Decode a single command and update state.
+
+        Commands are either "key=value" strings or (key, value) tuples whose
+        values were already parsed by a binary decoder."""
+        if isinstance(command, tuple):
+            key, value = command
+        else:
+            parts = command.split('=', 1)
+            if len(parts) != 2:
+                return
+            key, value = parts
         if key == 'brush.type':
             self.current_brush = value
         elif key == 'brush.size':
@@ -41,18 +112,45 @@ class BaseStrokeConsumer:
                 pass
         elif key == 'color.set.rgb':
             try:
-                rgb = [float(x) for x in value.split(',')]
+                if isinstance(value, str):
+                    value = value.split(',')
+                rgb = [float(x) for x in value]
                 self.current_color = tuple(rgb)
             except Exception:
                 pass
         elif key == 'draw.stroke':
             try:
-                stroke_data = json.loads(f'[{value}]')
-                self.current_path = [list(map(float, pt)) for pt in stroke_data]
+                if isinstance(value, str):
+                    stroke_data = json.loads(f'[{value}]')
+                    self.current_path = [list(map(float, pt)) for pt in stroke_data]
+                else:
+                    self.current_path = value
                 self.path_ready = True
             except Exception:
                 pass
 
+    def path_length(self) -> int:
+        """Number of points in the current path (0 when there is none)."""
+        return 0 if self.current_path is None else len(self.current_path)
+
+    def current_chunk_key(self) -> Optional[ChunkKey]:
+        """Grid cell for the current path, or None when spatial chunking is off."""
+        settings = getattr(bpy.context.scene, 'openbrush_settings', None)
+        if settings is None or not settings.use_spatial_chunks or not self.path_length():
+            return None
+        return chunk_key(self.current_path, settings.chunk_size)
+
+    def current_lod_ratio(self) -> Optional[float]:
+        """Point-count ratio for the LOD variant, or None when LODs are off."""
+        settings = getattr(bpy.context.scene, 'openbrush_settings', None)
+        if settings is None or not settings.use_lod:
+            return None
+        return float(settings.lod_ratio)
+
+    def show_lod_in_viewport(self) -> bool:
+        settings = getattr(bpy.context.scene, 'openbrush_settings', None)
+        return settings is None or settings.lod_viewport_mode != 'FULL'
+
     def process_current_path(self) -> None:
         """Override in subclasses to process the current path."""
         print(f"Processing path: {self.current_path}")
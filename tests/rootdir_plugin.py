@@ -0,0 +1,17 @@
+"""pytest plugin: collect the repository root as a plain directory.
+
+The root is the add-on package, and its __init__.py needs bpy. Collecting
+it as a package would import that file, so it is treated as a directory;
+tests load the modules they cover directly."""
+
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_collect_directory(path, parent):
+    if str(path) == ROOT:
+        return pytest.Dir.from_parent(parent, path=path)
+    return None
@@ -0,0 +1,56 @@
+"""Tests for the reorder buffer. sequencing.py is pure Python, so it is loaded
+directly instead of through the add-on package, which needs bpy.
+
+Run from the repository root with python -m pytest (see pytest.ini), or with
+python -m unittest discover -s tests"""
+
+import importlib.util
+import os
+import unittest
+
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sequencing.py")
+_spec = importlib.util.spec_from_file_location("openbrush_sequencing", _PATH)
+sequencing = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sequencing)
+
+ReorderBuffer = sequencing.ReorderBuffer
+S = sequencing.SequencedCommands
+S2 = sequencing.SourcedCommands
+
+
+class ReorderBufferTest(unittest.TestCase):
+
+    def test_first_request_arriving_late_is_not_dropped(self):
+        buffer = ReorderBuffer()
+        self.assertEqual(buffer.push(S('a', 1, ['draw.stroke=c1']), now=0.0), [])
+        self.assertEqual(buffer.push(S('a', 0, ['brush.type=b0', 'color.set.rgb=c0']), now=0.1),
+                         ['brush.type=b0', 'color.set.rgb=c0', 'draw.stroke=c1'])
+        self.assertEqual(buffer.stats()['duplicates'], 0)
+
+    def test_duplicates_are_dropped(self):
+        buffer = ReorderBuffer()
+        self.assertEqual(buffer.push(S('a', 0, ['x']), now=0.0), ['x'])
+        self.assertEqual(buffer.push(S('a', 0, ['x']), now=0.0), [])
+        self.assertEqual(buffer.stats()['duplicates'], 1)
+
+    def test_gap_is_skipped_after_timeout(self):
+        buffer = ReorderBuffer(gap_timeout=2.0)
+        buffer.push(S('a', 0, ['c0']), now=0.0)
+        self.assertEqual(buffer.push(S('a', 2, ['c2']), now=1.0), [])
+        self.assertEqual(buffer.expire(now=2.5), [])
+        self.assertEqual(buffer.expire(now=3.0), [S2('a', ['c2'])])
+        self.assertEqual(buffer.stats(), {'sources': 1, 'waiting': 0, 'duplicates': 0, 'gaps_skipped': 1})
+        # A late arrival for the skipped request counts as a duplicate
+        self.assertEqual(buffer.push(S('a', 1, ['c1']), now=3.5), [])
+        self.assertEqual(buffer.push(S('a', 3, ['c3']), now=3.5), ['c3'])
+
+    def test_gap_is_skipped_when_capacity_is_exceeded(self):
+        buffer = ReorderBuffer(capacity=2)
+        buffer.push(S('a', 1, ['c1']), now=0.0)
+        buffer.push(S('a', 2, ['c2']), now=0.0)
+        self.assertEqual(buffer.push(S('a', 3, ['c3']), now=0.0), ['c1', 'c2', 'c3'])
+        self.assertEqual(buffer.stats()['gaps_skipped'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
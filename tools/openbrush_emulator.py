@@ -0,0 +1,405 @@
+"""
+Stand-in for the Open Brush API and soak-test load generator.
+
+Runs outside Blender. In `serve` mode it listens like Open Brush on
+localhost:40074 and, when the add-on's "Register with Open Brush" button
+calls /api/v1?listenfor.strokes=<url>, starts pushing strokes to that URL.
+A later registration (the add-on re-registers after listener restarts)
+ends the active run and starts a new one, so runs never overlap.
+In `run` mode it pushes straight to --target without waiting for a
+registration.
+
+Strokes are synthetic (random walks using real brush GUIDs from
+brush_mappings.py) or replayed from a recording with one command per line,
+e.g. "brush.type=<guid>". Each run prints per-interval and final reports
+with the request latency distribution, dropped commands (transport errors,
+non-200 responses or error statuses) and the listener's RSS when --pid
+is given. The final report also compares the strokes sent with the stroke
+count on the listener's /metrics route, which catches strokes lost after
+the listener accepted them (turn Level of Detail off, since LOD copies
+are counted too).
+
+Memory use stays flat over long runs: run-wide latencies are kept in a
+fixed log-scale histogram, not as individual samples.
+
+Examples:
+    python tools/openbrush_emulator.py serve --rate 20 --concurrency 2
+    python tools/openbrush_emulator.py run --target http://localhost:8080/ \\
+        --rate 100 --concurrency 8 --duration 14400 --pid $(pgrep -f blender)
+"""
+
+import argparse
+import bisect
+import http.client
+import http.server
+import importlib.util
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlparse, parse_qs, quote_plus
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_module(name):
+    """Load a bpy-free add-on module by path, without importing the add-on package."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_rss_kb(pid):
+    """Resident set size of a process in KiB, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss // 1024
+    except Exception:
+        return None
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LatencyHistogram:
+    """Fixed-size log-scale latency histogram (2% wide buckets, 10us to 100s)."""
+
+    MIN = 1e-5
+    GROWTH = 1.02
+
+    def __init__(self):
+        count = int(math.ceil(math.log(100.0 / self.MIN, self.GROWTH))) + 1
+        self.bounds = [self.MIN * self.GROWTH ** i for i in range(count)]
+        self.counts = [0] * (count + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, latency):
+        self.counts[bisect.bisect_left(self.bounds, latency)] += 1
+        self.total += 1
+        self.max = max(self.max, latency)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples."""
+        if not self.total:
+            return 0.0
+        rank = max(1, int(math.ceil(fraction * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+
+class Stats:
+    """Thread-safe latency and drop counters, reset per reporting interval."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.sent = 0
+        self.dropped = 0
+        self.total_sent = 0
+        self.total_dropped = 0
+        self.strokes_sent = 0
+        self.histogram = LatencyHistogram()
+        self.rss_samples = []
+
+    def record(self, latency, ok):
+        with self.lock:
+            self.latencies.append(latency)
+            self.histogram.add(latency)
+            self.sent += 1
+            self.total_sent += 1
+            if not ok:
+                self.dropped += 1
+                self.total_dropped += 1
+
+    def record_stroke(self):
+        with self.lock:
+            self.strokes_sent += 1
+
+    def take_interval(self):
+        with self.lock:
+            latencies, self.latencies = self.latencies, []
+            sent, dropped = self.sent, self.dropped
+            self.sent = self.dropped = 0
+        return sorted(latencies), sent, dropped
+
+
+def format_latencies(latencies):
+    ms = [v * 1000 for v in latencies]
+    return (f"p50={percentile(ms, 0.5):.2f}ms p90={percentile(ms, 0.9):.2f}ms "
+            f"p99={percentile(ms, 0.99):.2f}ms max={(ms[-1] if ms else 0):.2f}ms")
+
+
+def format_histogram(histogram):
+    return (f"p50<={histogram.percentile(0.5) * 1000:.2f}ms p90<={histogram.percentile(0.9) * 1000:.2f}ms "
+            f"p99<={histogram.percentile(0.99) * 1000:.2f}ms max={histogram.max * 1000:.2f}ms")
+
+
+class StrokeSource:
+    """Yields lists of commands, one list per stroke."""
+
+    def __init__(self, args):
+        self.points = args.points
+        self.recording = None
+        if args.recording:
+            with open(args.recording) as f:
+                self.recording = [line.strip() for line in f if line.strip()]
+        brush_mappings = load_module("brush_mappings")
+        self.brushes = [guid for guid, _ in brush_mappings.get_brushes_by_property(is_experimental=False)]
+
+    def strokes(self, rng):
+        if self.recording:
+            while True:
+                stroke = []
+                for command in self.recording:
+                    stroke.append(command)
+                    if command.startswith("draw.stroke="):
+                        yield stroke
+                        stroke = []
+        while True:
+            yield self.synthetic(rng)
+
+    def synthetic(self, rng):
+        x, y, z = rng.uniform(-2, 2), rng.uniform(0, 2), rng.uniform(-2, 2)
+        points = []
+        for _ in range(self.points):
+            x += rng.uniform(-0.02, 0.02)
+            y += rng.uniform(-0.02, 0.02)
+            z += rng.uniform(-0.02, 0.02)
+            points.append(f"[{x:.4f},{y:.4f},{z:.4f},0,0,0,{rng.uniform(0.5, 1.0):.3f}]")
+        color = ",".join(f"{rng.random():.3f}" for _ in range(3))
+        return [
+            f"brush.type={rng.choice(self.brushes)}",
+            f"brush.size={rng.uniform(0.5, 3.0):.2f}",
+            f"color.set.rgb={color}",
+            "draw.stroke=" + ",".join(points),
+        ]
+
+
+class LoadRun:
+    """Pushes strokes to a listener from several worker threads at a fixed total rate."""
+
+    def __init__(self, target, args):
+        self.target = urlparse(target)
+        self.args = args
+        self.source = StrokeSource(args)
+        self.stats = Stats()
+        self.stop_event = threading.Event()
+
+    def worker(self, index):
+        rng = random.Random(self.args.seed + index)
+        interval = self.args.concurrency / self.args.rate
+        connection = http.client.HTTPConnection(self.target.hostname, self.target.port or 80, timeout=10)
+        path = self.target.path or "/"
+        seq = 0
+        next_time = time.monotonic()
+        for stroke in self.source.strokes(rng):
+            if self.stop_event.is_set():
+                break
+            stroke_ok = True
+            for command in stroke:
+                headers = {"Content-Type": "application/x-www-form-urlencoded"}
+                if self.args.sequenced:
+                    headers["X-OpenBrush-Source"] = f"emulator-{index}"
+                    headers["X-OpenBrush-Seq"] = str(seq)
+                    seq += 1
+                start = time.perf_counter()
+                ok = False
+                try:
+                    connection.request("POST", path, quote_plus(command), headers)
+                    response = connection.getresponse()
+                    body = response.read()
+                    ok = response.status == 200 and json.loads(body).get('status') != 'error'
+                except (OSError, http.client.HTTPException, ValueError):
+                    connection.close()
+                self.stats.record(time.perf_counter() - start, ok)
+                stroke_ok = stroke_ok and ok
+            if stroke_ok:
+                self.stats.record_stroke()
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                self.stop_event.wait(delay)
+        connection.close()
+
+    def run(self):
+        print(f"Pushing {self.args.rate} strokes/s to {self.target.geturl()} "
+              f"with {self.args.concurrency} workers for {self.args.duration}s")
+        baseline = self.listener_stroke_count()
+        workers = [threading.Thread(target=self.worker, args=(i,), daemon=True)
+                   for i in range(self.args.concurrency)]
+        for worker in workers:
+            worker.start()
+        end = time.monotonic() + self.args.duration
+        try:
+            while time.monotonic() < end and not self.stop_event.is_set():
+                self.stop_event.wait(min(self.args.report_interval, max(0, end - time.monotonic())))
+                self.report_interval()
+        except KeyboardInterrupt:
+            pass
+        self.stop_event.set()
+        for worker in workers:
+            worker.join()
+        self.report_final(baseline)
+
+    def listener_stroke_count(self):
+        """Total strokes created by the add-on according to /metrics, or None."""
+        connection = http.client.HTTPConnection(self.target.hostname, self.target.port or 80, timeout=5)
+        try:
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            return json.loads(response.read())['metrics']['total']['strokes']
+        except (OSError, http.client.HTTPException, ValueError, KeyError, TypeError):
+            return None
+        finally:
+            connection.close()
+
+    def settled_stroke_count(self, timeout=60.0, quiet=2.0):
+        """Wait for the listener to work through its queue, then return its stroke count."""
+        count = self.listener_stroke_count()
+        deadline = time.monotonic() + timeout
+        while count is not None and time.monotonic() < deadline:
+            time.sleep(quiet)
+            latest = self.listener_stroke_count()
+            if latest == count:
+                break
+            count = latest
+        return count
+
+    def report_interval(self):
+        latencies, sent, dropped = self.stats.take_interval()
+        line = f"[{time.strftime('%H:%M:%S')}] sent={sent} dropped={dropped} {format_latencies(latencies)}"
+        if self.args.pid:
+            rss = read_rss_kb(self.args.pid)
+            if rss is not None:
+                self.stats.rss_samples.append(rss)
+                line += f" rss={rss / 1024:.1f}MiB"
+        print(line, flush=True)
+
+    def report_final(self, baseline):
+        self.stats.take_interval()
+        print("=== Summary ===")
+        print(f"commands sent: {self.stats.total_sent}, dropped: {self.stats.total_dropped}")
+        print(f"latency: {format_histogram(self.stats.histogram)}")
+        final = self.settled_stroke_count() if baseline is not None else None
+        if final is None:
+            print(f"strokes sent: {self.stats.strokes_sent} (listener /metrics unavailable)")
+        else:
+            created = final - baseline
+            print(f"strokes sent: {self.stats.strokes_sent}, created by listener: {created}, "
+                  f"lost after acceptance: {max(0, self.stats.strokes_sent - created)}")
+        if self.stats.rss_samples:
+            rss = self.stats.rss_samples
+            print(f"listener rss: start={rss[0] / 1024:.1f}MiB min={min(rss) / 1024:.1f}MiB "
+                  f"max={max(rss) / 1024:.1f}MiB end={rss[-1] / 1024:.1f}MiB")
+
+
+class RunSlot:
+    """Holds the one load run driven by the emulated API. The add-on
+    re-registers after listener restarts and reconnects, so each new
+    registration stops the active run (after its final report) and then
+    starts a fresh one; runs never overlap."""
+
+    def __init__(self, args):
+        self.args = args
+        self.lock = threading.Lock()
+        self.run = None
+        self.thread = None
+
+    def replace(self, target):
+        with self.lock:
+            previous, previous_thread = self.run, self.thread
+            run = LoadRun(target, self.args)
+            self.run = run
+            self.thread = threading.Thread(target=self._start_after, args=(previous, previous_thread, run),
+                                           daemon=True)
+            self.thread.start()
+
+    def _start_after(self, previous, previous_thread, run):
+        if previous_thread is not None and previous_thread.is_alive():
+            print("New registration: stopping the active run")
+            previous.stop_event.set()
+            previous_thread.join()
+        with self.lock:
+            if self.run is not run:
+                return  # Replaced again while waiting
+        run.run()
+
+
+def make_api_handler(args):
+    slot = RunSlot(args)
+
+    class ApiHandler(http.server.BaseHTTPRequestHandler):
+        """Minimal Open Brush /api/v1 endpoint accepting listenfor.strokes."""
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            params = parse_qs(parsed.query)
+            if parsed.path.rstrip('/') != "/api/v1" or "listenfor.strokes" not in params:
+                self.send_response(404)
+                self.end_headers()
+                return
+            target = params["listenfor.strokes"][0]
+            print(f"Registered listener {target}")
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"OK")
+            slot.replace(target)
+
+        def log_message(self, format, *log_args):
+            pass
+
+    return ApiHandler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["serve", "run"])
+    parser.add_argument("--target", default="http://localhost:8080/", help="listener URL for run mode")
+    parser.add_argument("--api-port", type=int, default=40074, help="port of the emulated Open Brush API")
+    parser.add_argument("--rate", type=float, default=10.0, help="total strokes per second")
+    parser.add_argument("--concurrency", type=int, default=1, help="number of sending workers")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds per run")
+    parser.add_argument("--points", type=int, default=50, help="points per synthetic stroke")
+    parser.add_argument("--recording", help="file of recorded commands, one per line, to replay")
+    parser.add_argument("--sequenced", action="store_true", help="send X-OpenBrush-Source/Seq headers")
+    parser.add_argument("--pid", type=int, help="listener (Blender) process ID to sample RSS from")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="seconds between reports")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.mode == "run":
+        LoadRun(args.target, args).run()
+        return 0
+
+    server = http.server.ThreadingHTTPServer(("localhost", args.api_port), make_api_handler(args))
+    print(f"Emulating Open Brush API on localhost:{args.api_port}; press Register in Blender")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Stroke wire formats accepted by the listener.
+
+Besides the URL-encoded text commands sent by Open Brush, the listener
+accepts a compact binary body selected by Content-Type:
+
+    body header   '<4sBBH'    magic b'OBS1', version, reserved, stroke count
+    per stroke    '<16sf3fIHH' brush GUID (uuid bytes, all zero for none),
+                              brush size, color r/g/b, point count,
+                              floats per point, reserved
+                  point_count * floats_per_point little-endian float32
+
+Points use the same layout as the text `draw.stroke` command (x, y, z,
+rotation..., pressure) in Unity coordinates. Binary strokes decode into
+(key, value) command tuples whose values are already parsed, with the
+points as a numpy array viewed straight from the body.
+
+Any body may additionally be compressed with Content-Encoding gzip or
+deflate. Bodies are limited to MAX_BODY_SIZE both as sent and after
+decompression, so a small compressed body cannot expand into a huge
+allocation.
+"""
+
+import struct
+import uuid
+import zlib
+import numpy as np
+from typing import List, Tuple
+from urllib.parse import unquote_plus
+
+BINARY_CONTENT_TYPE = "application/x-openbrush-strokes"
+BINARY_MAGIC = b"OBS1"
+BINARY_VERSION = 1
+
+BODY_HEADER = struct.Struct('<4sBBH')
+STROKE_HEADER = struct.Struct('<16sf3fIHH')
+
+_POINT_DTYPE = np.dtype('<f4')
+
+# Largest decoded body or stream frame accepted
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+Command = Tuple[str, object]
+
+
+class WireFormatError(ValueError):
+    """Raised when a request body cannot be decoded."""
+
+
+def _inflate(data: bytes, wbits: int, max_size: int) -> bytes:
+    """Decompress with a size cap. gzip bodies may hold several members, which
+    are concatenated; any other trailing data is an error."""
+    parts = []
+    size = 0
+    while True:
+        decompressor = zlib.decompressobj(wbits)
+        # One byte over the remaining budget detects oversized bodies; a
+        # max_length of 0 would mean unlimited
+        part = decompressor.decompress(data, max_size - size + 1)
+        if not decompressor.unconsumed_tail:
+            part += decompressor.flush()
+        size += len(part)
+        if decompressor.unconsumed_tail or size > max_size:
+            raise WireFormatError(f"Decompressed body exceeds {max_size} bytes")
+        if not decompressor.eof:
+            raise zlib.error("incomplete or truncated stream")
+        parts.append(part)
+        data = decompressor.unused_data
+        if not data:
+            return b''.join(parts)
+        if wbits != 16 + zlib.MAX_WBITS:
+            raise zlib.error("trailing data after compressed stream")
+
+
+def decompress_body(data: bytes, content_encoding: str, max_size: int = MAX_BODY_SIZE) -> bytes:
+    """Undo a gzip or deflate Content-Encoding; identity bodies pass through.
+    Raises WireFormatError if the decompressed body exceeds max_size."""
+    encoding = (content_encoding or '').strip().lower()
+    if encoding in ('', 'identity'):
+        return data
+    try:
+        if encoding in ('gzip', 'x-gzip'):
+            return _inflate(data, 16 + zlib.MAX_WBITS, max_size)
+        if encoding == 'deflate':
+            try:
+                return _inflate(data, zlib.MAX_WBITS, max_size)
+            except zlib.error:
+                # Some clients send raw deflate without the zlib wrapper
+                return _inflate(data, -zlib.MAX_WBITS, max_size)
+    except zlib.error as e:
+        raise WireFormatError(f"Invalid {encoding} body: {e}") from e
+    raise WireFormatError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+def decode_text_body(data: bytes) -> str:
+    """Decode a URL-encoded UTF-8 command body."""
+    return unquote_plus(data.decode('utf-8'))
+
+
+def is_binary_content_type(content_type: str) -> bool:
+    return (content_type or '').split(';', 1)[0].strip().lower() == BINARY_CONTENT_TYPE
+
+
+def encode_binary_strokes(strokes) -> bytes:
+    """Encode an iterable of (brush_guid, size, color, points) tuples.
+    Used by producers and test tools; points is any (N, K) float sequence."""
+    strokes = list(strokes)
+    parts = [BODY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(strokes))]
+    for brush_guid, size, color, points in strokes:
+        points = np.ascontiguousarray(points, dtype=_POINT_DTYPE)
+        if points.ndim != 2:
+            raise WireFormatError("Stroke points must be a 2D array")
+        guid_bytes = uuid.UUID(brush_guid).bytes if brush_guid else bytes(16)
+        parts.append(STROKE_HEADER.pack(guid_bytes, size, *color, points.shape[0], points.shape[1], 0))
+        parts.append(points.tobytes())
+    return b''.join(parts)
+
+
+def decode_binary_strokes(data: bytes) -> List[Command]:
+    """Decode a binary stroke body into pre-parsed command tuples."""
+    if len(data) < BODY_HEADER.size:
+        raise WireFormatError("Binary body shorter than header")
+    magic, version, _, stroke_count = BODY_HEADER.unpack_from(data, 0)
+    if magic != BINARY_MAGIC:
+        raise WireFormatError(f"Bad magic {magic!r}")
+    if version != BINARY_VERSION:
+        raise WireFormatError(f"Unsupported binary version {version}")
+
+    commands: List[Command] = []
+    offset = BODY_HEADER.size
+    for _ in range(stroke_count):
+        if len(data) < offset + STROKE_HEADER.size:
+            raise WireFormatError("Truncated stroke header")
+        guid_bytes, size, r, g, b, point_count, stride, _ = STROKE_HEADER.unpack_from(data, offset)
+        offset += STROKE_HEADER.size
+
+        byte_count = point_count * stride * _POINT_DTYPE.itemsize
+        if stride < 3 or len(data) < offset + byte_count:
+            raise WireFormatError("Truncated or malformed stroke points")
+        points = np.frombuffer(data, dtype=_POINT_DTYPE, count=point_count * stride, offset=offset)
+        offset += byte_count
+
+        if any(guid_bytes):
+            commands.append(('brush.type', str(uuid.UUID(bytes=guid_bytes))))
+        commands.append(('brush.size', size))
+        commands.append(('color.set.rgb', (r, g, b)))
+        commands.append(('draw.stroke', points.reshape(point_count, stride)))
+    return commands
+
+
+# --- Length-prefixed framing for persistent stream connections ---
+#
+# Each frame is '<IB' (payload length, kind) followed by the payload. Text
+# frames carry one URL-encoded command, binary frames carry a binary stroke
+# body as described above.
+
+FRAME_HEADER = struct.Struct('<IB')
+FRAME_TEXT = 0
+FRAME_BINARY = 1
+MAX_FRAME_SIZE = MAX_BODY_SIZE
+
+
+def encode_frame(kind: int, payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+def decode_frame(kind: int, payload: bytes) -> List[object]:
+    """Decode one frame into commands ready for the stroke queue."""
+    if kind == FRAME_TEXT:
+        return [decode_text_body(payload)]
+    if kind == FRAME_BINARY:
+        return decode_binary_strokes(payload)
+    raise WireFormatError(f"Unknown frame kind {kind}")
+
+
+class FrameReader:
+    """Incrementally splits a byte stream into (kind, payload) frames."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Tuple[int, bytes]]:
+        self.buffer += data
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= FRAME_HEADER.size:
+            length, kind = FRAME_HEADER.unpack_from(self.buffer, offset)
+            if length > MAX_FRAME_SIZE:
+                raise WireFormatError(f"Frame of {length} bytes exceeds limit")
+            end = offset + FRAME_HEADER.size + length
+            if len(self.buffer) < end:
+                break
+            frames.append((kind, bytes(self.buffer[offset + FRAME_HEADER.size:end])))
+            offset = end
+        if offset:
+            del self.buffer[:offset]
+        return frames